@@ -86,8 +86,8 @@ def detect_git_repo_info(start_dir: Path) -> dict | None:
     Owner/repo parsed from 'origin' URL. Branch from HEAD.
     """
     def _git(args, cwd):
-        p = subprocess.run(["git", *args], cwd=cwd, text=True,
-                           stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        p = subprocess.run([os.getenv("GIT_BIN") or "git", *args], cwd=cwd, encoding="utf-8", errors="replace",
+                           stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         if p.returncode != 0:
             return None
         return p.stdout.strip()
@@ -35,14 +35,17 @@ import re
 import sys
 import csv
 import html
+import heapq
+import json
+import time
 import datetime
 import logging
 from logging import FileHandler, StreamHandler
 from pathlib import Path
-from typing import List, Tuple, Dict, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import requests
-from PIL import Image
+from PIL import Image, ImageChops
 
 # ---------------- paths + logging ----------------
 SCRIPT_PATH = Path(__file__).resolve()
@@ -61,6 +64,10 @@ MISSING_NO_URL_TXT = DOWNLOADS_DIR / "missing_names_no_url.txt"
 MISSING_WITH_URLS_CSV = DOWNLOADS_DIR / "missing_with_urls.csv"
 CONVERT_WARN_FILE = CONFIG_DIR / "convert_warning.log"
 
+# Parsed README names shared between runs/steps; reused while younger than the TTL
+ONLINE_NAMES_CACHE = CONFIG_DIR / "online_names.json"
+ONLINE_NAMES_TTL_SEC = 3600
+
 
 def setup_logging():
     root_handlers = [
@@ -91,6 +98,11 @@ def write_to_download_log(message: str) -> None:
     dlog.info(message)
 
 
+# ---------------- http ----------------
+# One keep-alive session for every GitHub/TMDB fetch in this run (no TLS handshake per request)
+SESSION = requests.Session()
+
+
 # ---------------- helpers ----------------
 def _normalize_name(name: str) -> str:
     for suffix in (" (Director)", " (Producer)", " (Writer)", "'s Birthday"):
@@ -106,7 +118,7 @@ def is_text_file(p: Path) -> bool:
 
 def download_file(url: str, destination: Path) -> bool:
     try:
-        r = requests.get(url, timeout=30)
+        r = SESSION.get(url, timeout=30)
         r.raise_for_status()
     except requests.RequestException as e:
         write_to_log_file(f"Failed to download {url} → {e}")
@@ -121,39 +133,40 @@ def download_file(url: str, destination: Path) -> bool:
 
 def determine_image_mode(image_path: Path) -> str:
     """Return 'RGB' or 'Grayscale' (anything not RGB = Grayscale for our routing)."""
+    color_variation_threshold = 30
     with Image.open(image_path) as img:
-        img = img.convert("RGB")
-        r, g, b = img.split()
-        color_variation_threshold = 30
-        for rv, gv, bv in zip(r.getdata(), g.getdata(), b.getdata()):
-            if abs(rv - gv) > color_variation_threshold or abs(rv - bv) > color_variation_threshold or abs(gv - bv) > color_variation_threshold:
-                return "RGB"
+        if img.mode in ("1", "L", "LA", "I", "F"):
+            return "Grayscale"
+        # convert() to the same mode still copies the whole raster; split RGB sources directly
+        r, g, b = (img if img.mode == "RGB" else img.convert("RGB")).split()
+    # max |a-b| per channel pair, computed in C instead of a per-pixel Python loop
+    for a, c in ((r, g), (r, b), (g, b)):
+        if ImageChops.difference(a, c).getextrema()[1] > color_variation_threshold:
+            return "RGB"
     return "Grayscale"
 
 
-# ---------------- log parsing (robust) ----------------
+# ---------------- log parsing (robust, streamed per line) ----------------
 PAT_UPDATED = re.compile(
     r"\[\d{4}-\d{2}-\d{2}\s.*?\[.*?\]\s*\|\s*Detail:\s*tmdb_person updated poster to \[URL\]\s*"
-    r"(https[^\s|]+)\s*\|"
-    r"[\s\S]*?Finished\s+(.*?)\s+Collection",
+    r"(https[^\s|]+)\s*\|",
     re.IGNORECASE
 )
 
 # Anthony Mann case: poster found via TMDB but metadata update not needed
-PAT_FOUND = re.compile(
-    r"1\s+poster\s+found:[\s\S]*?Method:\s*tmdb_person\s*Poster:\s*(https[^\s|]+)"
-    r"[\s\S]*?Finished\s+(.*?)\s+Collection",
-    re.IGNORECASE
-)
+PAT_FOUND = re.compile(r"1\s+poster\s+found:", re.IGNORECASE)
+PAT_FOUND_URL = re.compile(r"Method:\s*tmdb_person\s*Poster:\s*(https[^\s|]+)", re.IGNORECASE)
+
+# Both block kinds are closed by the next "Finished <name> Collection" line
+PAT_FINISHED = re.compile(r"Finished\s+(.*?)\s+Collection", re.IGNORECASE)
 
-# Names-only warning lines (no URL available in the log)
+# Names-only warning lines (no URL available in the log); case-sensitive like the GitHub URL itself
 WARN_PATTERN = re.compile(
-    r"Collection Warning:\s+No Poster Found at\s+https://raw\.githubusercontent\.com/Kometa-Team/People-Images(?:-[a-z]+)?/(?:main|master)/(.+?)\s",
-    re.IGNORECASE
+    r"Collection Warning:\s+No Poster Found at\s+https://raw\.githubusercontent\.com/Kometa-Team/People-Images(?:-[a-z]+)?/(?:main|master)/(.+?)(?=\s|$)"
 )
 
 
-def extract_convert_warning(lines: List[str]) -> List[str]:
+def extract_convert_warning(lines: Iterable[str]) -> List[str]:
     convert_warning_lines = []
     for line in lines:
         if "Convert Warning:" in line:
@@ -168,25 +181,67 @@ def extract_convert_warning(lines: List[str]) -> List[str]:
     return unique_lines
 
 
-def parse_tmdb_blocks(text: str) -> Dict[str, str]:
+def parse_log_lines(lines: Iterable[str]) -> Tuple[Dict[str, str], Set[str], List[str]]:
     """
-    Return dict: { normalized_name: full_url }
-    Covers both 'updated poster' and 'found but not updated' cases.
+    Single pass over a log's lines (the file is never loaded whole).
+    Returns ({ normalized_name: full_url }, names from No Poster Found warnings,
+    raw lines containing "Convert Warning:").
+    Covers both 'updated poster' and 'found but not updated' cases; only the pending
+    URL of an open block is carried between lines until its Finished line shows up.
     """
-    out: Dict[str, str] = {}
-    for url, name in PAT_UPDATED.findall(text):
-        name = _normalize_name(html.unescape(name))
-        out.setdefault(name, url)
-    for url, name in PAT_FOUND.findall(text):
-        name = _normalize_name(html.unescape(name))
-        out.setdefault(name, url)
-    return out
+    updated: Dict[str, str] = {}
+    found: Dict[str, str] = {}
+    warn_names: Set[str] = set()
+    convert_lines: List[str] = []
+    updated_url: Optional[str] = None
+    found_open = False
+    found_url: Optional[str] = None
+
+    for line in lines:
+        if "Convert Warning:" in line:
+            convert_lines.append(line)
+        warn_names |= parse_no_poster_warnings(line)
+
+        # 'updated poster' block: Detail line with URL ... Finished <name> Collection
+        pos = 0
+        if updated_url is None:
+            m = PAT_UPDATED.search(line)
+            if m:
+                updated_url, pos = m.group(1), m.end()
+        if updated_url is not None:
+            f = PAT_FINISHED.search(line, pos)
+            if f:
+                updated.setdefault(_normalize_name(html.unescape(f.group(1))), updated_url)
+                updated_url = None
+
+        # 'found but not updated' block: 1 poster found ... tmdb_person URL ... Finished <name> Collection
+        pos = 0
+        if found_url is None:
+            if not found_open:
+                m = PAT_FOUND.search(line)
+                if m:
+                    found_open, pos = True, m.end()
+            if found_open:
+                m = PAT_FOUND_URL.search(line, pos)
+                if m:
+                    found_open, found_url, pos = False, m.group(1), m.end()
+        if found_url is not None:
+            f = PAT_FINISHED.search(line, pos)
+            if f:
+                found.setdefault(_normalize_name(html.unescape(f.group(1))), found_url)
+                found_url = None
+
+    # 'updated poster' wins over 'found' for the same name
+    for n, u in found.items():
+        updated.setdefault(n, u)
+    return updated, warn_names, convert_lines
 
 
 def parse_no_poster_warnings(text: str) -> Set[str]:
     names: Set[str] = set()
-    t = text.replace("\r\n", "\n") + " "
-    for frag in WARN_PATTERN.findall(t):
+    if "No Poster Found at" not in text:
+        return names
+    for frag in WARN_PATTERN.findall(text):
         frag = frag.lstrip("/")
         last = frag.split("/")[-1]
         if "." in last:
@@ -196,14 +251,45 @@ def parse_no_poster_warnings(text: str) -> Set[str]:
 
 
 # ---------------- online presence ----------------
+def load_cached_online_names(styles: List[str], branch: str) -> Optional[Set[str]]:
+    """Return names from ONLINE_NAMES_CACHE if it is fresh and was built for the same styles/branch."""
+    try:
+        if time.time() - ONLINE_NAMES_CACHE.stat().st_mtime > ONLINE_NAMES_TTL_SEC:
+            return None
+        data = json.loads(ONLINE_NAMES_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("styles") != sorted(styles) or data.get("branch") != branch:
+        return None
+    return set(data.get("names", []))
+
+
+def save_cached_online_names(styles: List[str], branch: str, names: Set[str]) -> None:
+    tmp = ONLINE_NAMES_CACHE.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps({"styles": sorted(styles), "branch": branch, "names": sorted(names)},
+                                  ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, ONLINE_NAMES_CACHE)
+    except OSError as e:
+        write_to_log_file(f"Could not write online names cache {ONLINE_NAMES_CACHE}: {e}")
+
+
 def fetch_online_names(styles: List[str], branch: str = "master") -> Set[str]:
     """
     Parse README.md(s) for Kometa-Team People-Images-* repos and collect names already online.
     Default keeps legacy behavior: styles=["rainier"] unless overridden.
+    Results are cached in ONLINE_NAMES_CACHE for ONLINE_NAMES_TTL_SEC.
     """
+    cached = load_cached_online_names(styles, branch)
+    if cached is not None:
+        write_to_log_file(f"Online presence from cache {ONLINE_NAMES_CACHE.name} (styles={styles}) → {len(cached)} names")
+        return cached
+
     online: Set[str] = set()
     tried = set()
+    complete = True
     for style in styles:
+        got_readme = False
         for b in (branch, "main" if branch != "main" else "master"):
             url = f"https://raw.githubusercontent.com/Kometa-Team/People-Images-{style}/{b}/README.md"
             key = (style, b)
@@ -211,7 +297,7 @@ def fetch_online_names(styles: List[str], branch: str = "master") -> Set[str]:
                 continue
             tried.add(key)
             try:
-                r = requests.get(url, timeout=20)
+                r = SESSION.get(url, timeout=20)
             except requests.RequestException:
                 continue
             if r.status_code != 200:
@@ -225,8 +311,13 @@ def fetch_online_names(styles: List[str], branch: str = "master") -> Set[str]:
                     online.add(_normalize_name(html.unescape(name)))
                 except Exception:
                     continue
+            got_readme = True
             break
+        complete = complete and got_readme
     write_to_log_file(f"Online presence checked across styles={styles} → {len(online)} names")
+    # only cache a complete view; a failed README would otherwise hide names for the whole TTL
+    if complete:
+        save_cached_online_names(styles, branch, online)
     return online
 
 
@@ -272,11 +363,11 @@ def main():
 
     for item in input_files:
         write_to_log_file(f"Working on: {item.name}")
-        content = item.read_text(encoding="utf-8", errors="replace")
-        all_convert_warns.extend(extract_convert_warning(content.splitlines()))
-
-        # Gather URLs from both patterns (update + found/not-updated)
-        block_map = parse_tmdb_blocks(content)  # name -> url
+        # Stream the log: URLs from both patterns (update + found/not-updated),
+        # No Poster Found names, and Convert Warning lines in one pass
+        with item.open("r", encoding="utf-8", errors="replace") as fh:
+            block_map, warn_names, convert_lines = parse_log_lines(fh)  # name -> url
+        all_convert_warns.extend(extract_convert_warning(convert_lines))
         total_matches += len(block_map)
 
         # merge (first wins per name)
@@ -284,7 +375,7 @@ def main():
             name_to_url.setdefault(n, u)
 
         # gather names-only from No Poster Found warnings
-        names_from_warnings |= parse_no_poster_warnings(content)
+        names_from_warnings |= warn_names
 
         if not block_map:
             write_to_log_file("0 items found...")
@@ -311,8 +402,9 @@ def main():
     # Write outputs for later steps
     if missing_with_urls or missing_no_url:
         # All missing names (union) for quick consumption by later steps
+        # both lists come from sorted(candidate_names) and are disjoint → a merge is already the sorted union
         with MISSING_ALL_TXT.open("w", encoding="utf-8") as f:
-            for n in sorted(set(missing_no_url) | {n for n, _ in missing_with_urls}):
+            for n in heapq.merge(missing_no_url, (n for n, _ in missing_with_urls)):
                 f.write(f"{n}\n")
         write_to_log_file(f"Wrote missing names → {MISSING_ALL_TXT}")
 
@@ -348,9 +440,7 @@ def main():
                     final_dir = DOWNLOADS_DIR / subfolder
                     final_dir.mkdir(parents=True, exist_ok=True)
                     final_path = final_dir / temp_path.name
-                    if final_path.exists():
-                        final_path.unlink()
-                    temp_path.rename(final_path)
+                    os.replace(temp_path, final_path)  # atomic, overwrites existing
                     write_to_download_log(f"Image mode: {mode} → {final_path}")
                     new_downloads += 1
 
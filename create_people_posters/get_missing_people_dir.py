@@ -3,16 +3,18 @@
 Grayscale Image Copier
 
 Copies images from an input directory into ./config/Downloads/{other,color},
-classifying each file as 'Grayscale' or 'RGB' using PIL. Skips names found in
-the online README list (simple text containment, same as original logic).
+classifying each file as 'Grayscale' or 'RGB' using PIL. Skips names listed in
+the online README (exact name match against the README's poster links).
 
 Input directory resolution (in this order):
   1) CLI: --input_directory
   2) .env: POSTERS_INPUT_DIR   (loaded from ./config/.env if present)
   3) Default: ./config/posters (created if missing)
 
+POSTERS_LINK_MODE (env/.env): copy (default) | hardlink | reflink
+
 Usage:
-    python grayscale_copier.py --input_directory /path/to/images
+    python get_missing_people_dir.py --input_directory /path/to/images
 
 Dependencies:
     - Python 3.x
@@ -22,10 +24,19 @@ Dependencies:
 """
 
 import os
+import re
+import sys
+import json
 import shutil
-import datetime
+import sqlite3
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from logging import FileHandler, StreamHandler
 from pathlib import Path
-from PIL import Image
+from typing import Iterator
+from urllib.parse import unquote
+from PIL import Image, ImageChops, ImageFile
 import requests
 
 # Optional .env support
@@ -39,6 +50,7 @@ SCRIPT_PATH = Path(__file__).resolve()
 SCRIPT_DIR = SCRIPT_PATH.parent
 CONFIG_DIR = SCRIPT_DIR / "config"
 LOGS_DIR = CONFIG_DIR / "logs"
+CACHE_DIR = CONFIG_DIR / "cache"
 DOWNLOADS_DIR = CONFIG_DIR / "Downloads"
 OTHER_DIR = DOWNLOADS_DIR / "other"
 COLOR_DIR = DOWNLOADS_DIR / "color"
@@ -53,20 +65,53 @@ if load_dotenv:
 
 script_log = LOGS_DIR / f"{SCRIPT_PATH.stem}.log"
 download_log = LOGS_DIR / f"{SCRIPT_PATH.stem}_downloads.log"
+classify_cache_db = CONFIG_DIR / "classify_cache.sqlite"
+
+# One keep-alive session for GitHub raw content
+SESSION = requests.Session()
+
+# Poster links in the People-Images README: [Name](https://raw.githubusercontent.com/.../Name.jpg)
+README_LINK = re.compile(r"\[([^\]]+)\]\((https://raw\.githubusercontent\.com/[^)\s]+)\)")
+
+# How copy_file places files: copy | hardlink | reflink (see copy_file)
+LINK_MODE = os.getenv("POSTERS_LINK_MODE", "copy").strip().lower()
+
+# Rows per strip when scanning for colour (bounds the temporaries per comparison)
+STRIP_ROWS = 256
+
+# Classify what decodes from partially written/truncated downloads instead of dropping them
+ImageFile.LOAD_TRUNCATED_IMAGES = True
+
+
+def setup_logging():
+    # Handlers keep their files open for the whole run (no open/close per message)
+    root_handlers = [
+        FileHandler(script_log, encoding="utf-8", mode="w"),  # fresh script log each run
+        StreamHandler(sys.stdout),
+    ]
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=root_handlers,
+        force=True,
+    )
+    dl_logger = logging.getLogger("downloads")
+    dl_logger.setLevel(logging.INFO)
+    dl_logger.addHandler(FileHandler(download_log, encoding="utf-8", mode="a"))
+
+
+log = logging.getLogger(__name__)
+dlog = logging.getLogger("downloads")
 
 
 def write_to_log_file(message: str) -> None:
-    """Append a timestamped message to the script log file."""
-    with script_log.open("a", encoding="utf-8") as log_file:
-        log_file.write(f"{datetime.datetime.now()} ~ {message}\n")
-    print(f"{datetime.datetime.now()} ~ {message}")
+    """Log a message to the script log and console."""
+    log.info(message)
 
 
 def write_to_download_log(message: str) -> None:
-    """Append a timestamped message to the download log file."""
-    with download_log.open("a", encoding="utf-8") as log_file:
-        log_file.write(f"{datetime.datetime.now()} ~ {message}\n")
-    print(f"{datetime.datetime.now()} ~ {message}")
+    """Log a message to the download log (also echoed to the script log and console)."""
+    dlog.info(message)
 
 
 def resolve_input_directory(cli_value: str | None) -> Path:
@@ -86,113 +131,248 @@ def resolve_input_directory(cli_value: str | None) -> Path:
     return default_dir.resolve()
 
 
-def extract_filenames_from_source_directory(directory: Path) -> set[str]:
-    """Extract base filenames (without extensions) from the source directory."""
-    file_names: set[str] = set()
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            name, _ = os.path.splitext(filename)
-            file_names.add(name)
-    return file_names
+def iter_files(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield file entries under root, recursively, via os.scandir.
+    DirEntry carries the type from the directory listing, so no per-file stat() is needed.
+    Symlinked directories are not descended into (same as os.walk's default).
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _copy_file_range(source: Path, destination: Path) -> None:
+    """Copy in-kernel with os.copy_file_range (shares extents on btrfs/XFS where supported)."""
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            n = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if n == 0:
+                # source shrank or the filesystem stopped short: let copy_file redo it in full
+                raise OSError(f"copy_file_range stopped with {remaining} byte(s) left")
+            remaining -= n
 
 
 def copy_file(source: Path, destination: Path) -> None:
-    """Copy a file from the source path to the destination path."""
+    """
+    Copy a file from the source path to the destination path, per POSTERS_LINK_MODE:
+      copy     - plain shutil.copyfile (default; sendfile on Linux)
+      hardlink - os.link; no data copied, but source and destination share one inode,
+                 so editing either edits both
+      reflink  - os.copy_file_range; copy-on-write clone on filesystems that support it
+    hardlink/reflink fall back to shutil.copyfile across devices or where unsupported.
+    """
     destination.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copyfile(source, destination)
+    # never write through an existing (possibly hardlinked) destination
+    destination.unlink(missing_ok=True)
+    if LINK_MODE == "hardlink":
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)  # across devices / links not allowed
+    elif LINK_MODE == "reflink" and hasattr(os, "copy_file_range"):
+        try:
+            _copy_file_range(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)  # unsupported filesystem / stopped short
+    else:
+        shutil.copyfile(source, destination)
     write_to_log_file(f"Copied file from {source} => Saved as: {destination}")
 
 
-def determine_image_mode(image_path: Path) -> str:
+def classify_image(image_path: Path) -> str | None:
     """
-    Determine the mode of an image file ('RGB' or 'Grayscale').
-    Heuristic: convert to RGB and check channel variance per pixel.
+    Open an image once and classify it as 'RGB' or 'Grayscale'; None if it can't be read as an image.
+    JPEGs are decoded at half size or less via draft().
+    Heuristic: 'RGB' if any pixel has two channels more than the threshold apart.
+    Each channel pair is reduced in C (max |a-b| via ImageChops.difference + getextrema),
+    strip by strip, so colour found near the top stops the scan early.
     """
-    with Image.open(image_path) as image:
-        image = image.convert("RGB")
-        r, g, b = image.split()
-
-        color_variation_threshold = 30
-        for rv, gv, bv in zip(r.getdata(), g.getdata(), b.getdata()):
-            if (
-                abs(rv - gv) > color_variation_threshold
-                or abs(rv - bv) > color_variation_threshold
-                or abs(gv - bv) > color_variation_threshold
-            ):
-                return "RGB"
+    color_variation_threshold = 30
+    try:
+        with Image.open(image_path) as image:
+            if image.mode in ("1", "L", "LA", "I", "F"):
+                return "Grayscale"  # single-channel: no colour possible
+            if image.format == "JPEG":
+                # let libjpeg decode at reduced scale (DCT scaling); colour/no-colour survives downscaling
+                image.draft("RGB", (image.width // 2, image.height // 2))
+            # convert() to the same mode still copies the whole raster; use RGB sources directly
+            rgb = image if image.mode == "RGB" else image.convert("RGB")
+            w, h = rgb.size
+            for y0 in range(0, h, STRIP_ROWS):
+                r, g, b = rgb.crop((0, y0, w, min(y0 + STRIP_ROWS, h))).split()
+                for a, c in ((r, g), (r, b), (g, b)):
+                    if ImageChops.difference(a, c).getextrema()[1] > color_variation_threshold:
+                        return "RGB"
+    except OSError:  # includes UnidentifiedImageError / truncated files
+        return None
     return "Grayscale"
 
 
-def is_image_file(file_path: Path) -> bool:
-    """Return True if the file can be opened as an image."""
+def open_classify_cache() -> sqlite3.Connection:
+    """Open (creating if needed) the (path, size, mtime_ns) -> mode memo for classify_image."""
+    conn = sqlite3.connect(classify_cache_db)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS c ("
+        "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime INTEGER NOT NULL, mode TEXT)"
+    )
+    return conn
+
+
+def cached_get(url: str, timeout: int = 30) -> str:
+    """
+    GET a text resource, keeping a copy under ./config/cache and revalidating it with
+    If-None-Match / If-Modified-Since; a 304 returns the cached text without a download.
+    Raises requests.RequestException on failure.
+    """
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+    body_path = CACHE_DIR / f"{key}.txt"
+    meta_path = CACHE_DIR / f"{key}.json"
+    headers = {}
+    if body_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = SESSION.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and headers:
+        return body_path.read_text(encoding="utf-8")
+    response.raise_for_status()
+
     try:
-        with Image.open(file_path):
-            return True
-    except (IOError, OSError):
-        return False
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        body_path.write_text(response.text, encoding="utf-8")
+        meta_path.write_text(json.dumps({
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }), encoding="utf-8")
+    except OSError as e:
+        write_to_log_file(f"Could not cache {url}: {e}")
+    return response.text
 
 
 def fetch_online_file_names(online_url: str) -> str:
     """
     Fetch file names from an online URL.
-    Returns the raw text (original behavior).
+    Returns the raw text (original behavior), revalidated against the on-disk cache.
     """
     try:
-        response = requests.get(online_url, timeout=30)
-        response.raise_for_status()
+        return cached_get(online_url)
     except requests.RequestException:
-        print(f"Failed to fetch file names from the online URL: {online_url}")
+        log.warning(f"Failed to fetch file names from the online URL: {online_url}")
         return ""
 
-    return response.text
+
+def parse_readme_names(text: str) -> set[str]:
+    """
+    Collect poster names from README links (`* [Name](https://raw.githubusercontent.com/.../Name.jpg)`):
+    both the link label and the URL-decoded file stem.
+    """
+    names: set[str] = set()
+    for label, url in README_LINK.findall(text):
+        names.add(label.strip())
+        stem = os.path.splitext(unquote(url.rsplit("/", 1)[-1]))[0]
+        if stem:
+            names.add(stem)
+    return names
 
 
-def copy_grayscale_and_color_images(
-    directory: Path, online_file_names: str, source_file_names: set[str]
-) -> None:
+def copy_grayscale_and_color_images(directory: Path, online_names: set[str]) -> None:
     """
     Copy grayscale and color images from a directory to their respective
     download directories, excluding files whose names (without extensions)
-    are found in the online file names text (simple substring check).
+    are in the online README name set.
     """
     count_total = 0
     count_gray = 0
     count_color = 0
     count_skipped = 0
 
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            name, _ = os.path.splitext(filename)
-
-            # Skip copying the file if its name (without extension) is found online
-            if name and name in online_file_names:
-                print(f"File {filename} found in the online list. Skipping.")
-                try:
-                    os.remove(os.path.join(root, filename))
-                except OSError:
-                    pass
-                count_skipped += 1
-                continue
-
-            file_path = Path(root) / filename
-            if is_image_file(file_path):
-                image_mode = determine_image_mode(file_path)
-                collection_name, _ = os.path.splitext(filename)
-                if image_mode == "Grayscale":
-                    dest = OTHER_DIR / f"{collection_name}.jpg"
-                    copy_file(file_path, dest)
-                    write_to_download_log(
-                        f"Grayscale Image Copied: {filename} => Saved as: {dest}"
-                    )
-                    count_gray += 1
-                else:
-                    dest = COLOR_DIR / f"{collection_name}.jpg"
-                    copy_file(file_path, dest)
-                    write_to_download_log(
-                        f"Color Image Copied: {filename} => Saved as: {dest}"
-                    )
-                    count_color += 1
-                count_total += 1
+    conn = open_classify_cache()
+    known = {path: (size, mtime, mode) for path, size, mtime, mode in conn.execute("SELECT path, size, mtime, mode FROM c")}
+
+    candidates: list[Path] = []
+    stamps: list[tuple[int, int]] = []
+    for entry in iter_files(directory):
+        filename = entry.name
+        name, _ = os.path.splitext(filename)
+
+        # Skip copying the file if its name (without extension) is found online
+        if name and name in online_names:
+            write_to_log_file(f"File {filename} found in the online list. Skipping.")
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+            count_skipped += 1
+            continue
+
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        candidates.append(Path(entry.path))
+        stamps.append((st.st_size, st.st_mtime_ns))
+
+    # Unchanged files (same size + mtime) reuse their stored mode; only the rest get decoded
+    modes: list[str | None] = [None] * len(candidates)
+    misses: list[int] = []
+    for i, (path, stamp) in enumerate(zip(candidates, stamps)):
+        hit = known.get(str(path))
+        if hit is not None and hit[:2] == stamp:
+            modes[i] = hit[2]
+        else:
+            misses.append(i)
+    write_to_log_file(f"Classify cache: {len(candidates) - len(misses)} hit(s), {len(misses)} to decode")
+
+    # Decode + classify is CPU-bound: fan it out to worker processes; copies and logging stay here
+    if misses:
+        with ProcessPoolExecutor() as pool:
+            results = pool.map(classify_image, [candidates[i] for i in misses], chunksize=32)
+            for i, mode in zip(misses, results):
+                modes[i] = mode
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO c (path, size, mtime, mode) VALUES (?, ?, ?, ?)",
+                [(str(candidates[i]), *stamps[i], modes[i]) for i in misses],
+            )
+    conn.close()
+
+    for file_path, image_mode in zip(candidates, modes):
+        if image_mode is None:
+            continue
+        filename = file_path.name
+        collection_name = file_path.stem
+        if image_mode == "Grayscale":
+            dest = OTHER_DIR / f"{collection_name}.jpg"
+            copy_file(file_path, dest)
+            write_to_download_log(
+                f"Grayscale Image Copied: {filename} => Saved as: {dest}"
+            )
+            count_gray += 1
+        else:
+            dest = COLOR_DIR / f"{collection_name}.jpg"
+            copy_file(file_path, dest)
+            write_to_download_log(
+                f"Color Image Copied: {filename} => Saved as: {dest}"
+            )
+            count_color += 1
+        count_total += 1
 
     write_to_log_file(
         f"Summary: processed={count_total}, grayscale={count_gray}, color={count_color}, skipped_online={count_skipped}"
@@ -212,30 +392,24 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    # configured here, not at import: pool workers re-import this module and must not truncate the log
+    setup_logging()
+
     input_directory = resolve_input_directory(args.input_directory)
     write_to_log_file(f"Using input directory: {input_directory}")
 
     if not input_directory.exists():
-        print(f'Input directory "{input_directory}" not found. Exiting now...')
+        log.error(f'Input directory "{input_directory}" not found. Exiting now...')
         raise SystemExit(1)
 
-    # fresh script log each run
-    if script_log.exists():
-        try:
-            script_log.unlink()
-        except OSError:
-            pass
-
     write_to_log_file("#### START ####")
 
     # Fetch online content (kept minimal to match your current logic)
     online_file_url = "https://raw.githubusercontent.com/Kometa-Team/People-Images-rainier/master/README.md"
-    online_file_names = fetch_online_file_names(online_file_url)
-
-    # Extract file names from the source directory (currently unused, kept for parity with original signature)
-    source_file_names = extract_filenames_from_source_directory(input_directory)
+    online_names = parse_readme_names(fetch_online_file_names(online_file_url))
+    write_to_log_file(f"Online README lists {len(online_names)} name(s)")
 
     # Copy according to mode, excluding names seen online
-    copy_grayscale_and_color_images(input_directory, online_file_names, source_file_names)
+    copy_grayscale_and_color_images(input_directory, online_names)
 
     write_to_log_file("#### END ####")
\ No newline at end of file
@@ -5,12 +5,15 @@
 import sys
 import os
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from timeit import default_timer as timer
-from typing import Dict, Tuple
+from typing import List, Optional, Tuple
 
 from dotenv import load_dotenv
-from PIL import Image, ImageChops, ImageStat
+from PIL import Image, ImageStat
 from alive_progress import alive_bar
 
 # ========= PATHS & LOGGING =========
@@ -36,7 +39,6 @@ def setup_logging():
     return log_file
 
 
-LOG_FILE = setup_logging()
 load_dotenv(CONFIG_DIR / ".env")
 
 logging.getLogger("PIL").setLevel(logging.ERROR)
@@ -46,65 +48,88 @@ logging.getLogger("PIL.PngImagePlugin").setLevel(logging.ERROR)
 # (kept identical to your PowerShell checks)
 REQUIRED_WIDTH = 2000
 REQUIRED_HEIGHT = 3000
-BASE_IMAGE_RATIO = round(1 / 1.5, 4)  # 0.6667
+# Ratio is checked exactly as 3*w == 2*h (2:3 portrait), no float rounding
 BASE_W_QUALITY = 399
 BASE_H_QUALITY = 599
+N_CHECKS = 7  # WARNING1..WARNING7
 
 
 # ========= END CONFIG =====
 
 # ---------- Pillow helpers ----------
-def open_image(path: Path) -> Image.Image:
-    return Image.open(path)
-
-
-def get_dimensions(img: Image.Image) -> Tuple[int, int]:
-    return img.size
-
-
-def is_grayscale(img: Image.Image) -> bool:
-    # Equivalent to IM 'Type: Gray'
+def split_channels(img: Image.Image) -> Tuple[Optional[Tuple[Image.Image, ...]], Optional[Image.Image]]:
+    """
+    Decode once and split once: return ((r, g, b) or None for gray modes, alpha band or None).
+    RGB/RGBA are split in place; other colour modes go through a single RGB conversion.
+    """
     mode = img.mode
+    bands: Tuple[Image.Image, ...] = ()
     if mode in ("1", "L", "LA"):
+        rgb = None
+    elif mode in ("RGB", "RGBA"):
+        bands = img.split()
+        rgb = bands[:3]
+    else:
+        rgb = img.convert("RGB").split()
+    if mode == "RGBA":
+        alpha = bands[3]
+    elif "A" in img.getbands():
+        alpha = img.getchannel("A")
+    else:
+        alpha = None
+    return rgb, alpha
+
+
+def is_grayscale(rgb: Optional[Tuple[Image.Image, ...]]) -> bool:
+    # Equivalent to IM 'Type: Gray'; None means a gray mode (1/L/LA)
+    if rgb is None:
         return True
-    rgb = img.convert("RGB")
-    r, g, b = rgb.split()
-    return (ImageChops.difference(r, g).getbbox() is None and
-            ImageChops.difference(g, b).getbbox() is None)
+    r, g, b = rgb
+    # r == g == b everywhere ⇔ identical band buffers: one memcmp each instead of diff image + bbox scan
+    return r.tobytes() == g.tobytes() == b.tobytes()
 
 
-def has_any_transparency(img: Image.Image) -> bool:
+def has_any_transparency(alpha: Optional[Image.Image]) -> bool:
     # True if alpha exists and any pixel has alpha < 255
-    if "A" not in img.getbands():
+    if alpha is None:
         return False
-    lo, hi = img.getchannel("A").getextrema()
+    lo, hi = alpha.getextrema()
     return lo < 255
 
 
-def head_chop_alpha_mean(img: Image.Image) -> float:
+def head_chop_alpha_mean(alpha: Optional[Image.Image], size: Tuple[int, int]) -> float:
     # First-row alpha mean scaled to [0..1]
-    w, h = img.size
-    if w == 0 or h == 0:
-        return 1.0
-    alpha = img.getchannel("A") if "A" in img.getbands() else Image.new("L", (w, h), 255)
+    w, h = size
+    if w == 0 or h == 0 or alpha is None:
+        return 1.0  # no alpha ⇒ fully opaque row; no need to build a W×H plane to average it
     first_row = alpha.crop((0, 0, w, 1))
     return float(ImageStat.Stat(first_row).mean[0] / 255.0)
 
 
 # ---------- Checks (log only failures) ----------
-def test_image(image_path: Path, counters: Dict[str, int]):
+def test_image(image_path: Path) -> List[int]:
+    """Run all checks on one file; return this file's counter increments (index 0..6 = WARNING1..7)."""
+    counters = [0] * N_CHECKS
     filepre = str(image_path)
     name_wo_ext = image_path.stem
 
     try:
-        with open_image(image_path) as img:
-            w, h = get_dimensions(img)
-            ratio = round((w / h) if h else 0.0, 4)
+        with Image.open(image_path) as img:
+            w, h = img.size
+
+            # Decode + split once; checks 1-3 all read these bands
+            try:
+                rgb, alpha = split_channels(img)
+                pixels_ok = True
+            except Exception as e:
+                logging.warning("Decode error for %s (%s)", filepre, e)
+                rgb = alpha = None
+                pixels_ok = False
 
             # 1) Grayscale
             try:
-                if is_grayscale(img):
-                    counters["Counter1"] += 1
+                if pixels_ok and is_grayscale(rgb):
+                    counters[0] += 1
                     logging.warning(
                         "WARNING1!~%s~%s is Grayscale! Find a color image on TMDB and re-process",
                         filepre, name_wo_ext
@@ -114,8 +139,8 @@ def test_image(image_path: Path, counters: Dict[str, int]):
 
             # 2) Not Transparent
             try:
-                if not has_any_transparency(img):
-                    counters["Counter2"] += 1
+                if pixels_ok and not has_any_transparency(alpha):
+                    counters[1] += 1
                     logging.warning(
                         "WARNING2!~%s~%s is NOT Transparent and needs background removed!",
                         filepre, name_wo_ext
@@ -125,9 +150,9 @@ def test_image(image_path: Path, counters: Dict[str, int]):
 
             # 3) Head chop (first row alpha mean > 0.06)
             try:
-                head_val = head_chop_alpha_mean(img)
+                head_val = head_chop_alpha_mean(alpha, (w, h)) if pixels_ok else 0.0
                 if head_val > 0.06:
-                    counters["Counter3"] += 1
+                    counters[2] += 1
                     logging.warning(
                         "WARNING3!~%s~%s likely HEAD CHOP; review/change headshot. Headchop values~%s",
                         filepre, name_wo_ext, head_val
@@ -135,17 +160,17 @@ def test_image(image_path: Path, counters: Dict[str, int]):
             except Exception as e:
                 logging.warning("Head-chop check error for %s (%s)", filepre, e)
 
-            # 4) Ratio mismatch
-            if ratio != BASE_IMAGE_RATIO:
-                counters["Counter4"] += 1
+            # 4) Ratio mismatch (exact 2:3; zero height never matches)
+            if h == 0 or 3 * w != 2 * h:
+                counters[3] += 1
                 logging.warning(
-                    "WARNING4!~%s~%s Ratio should be %s, found >%s<",
-                    filepre, name_wo_ext, BASE_IMAGE_RATIO, ratio
+                    "WARNING4!~%s~%s Ratio should be 2:3, found >%d:%d<",
+                    filepre, name_wo_ext, w, h
                 )
 
             # 5) Width quality (> BASE_W_QUALITY)
             if not (w - BASE_W_QUALITY > 0):
-                counters["Counter5"] += 1
+                counters[4] += 1
                 logging.warning(
                     "WARNING5!~%s~%s Width should be > %s; found %s",
                     filepre, name_wo_ext, BASE_W_QUALITY, w
@@ -153,7 +178,7 @@ def test_image(image_path: Path, counters: Dict[str, int]):
 
             # 6) Height quality (> BASE_H_QUALITY)
             if not (h - BASE_H_QUALITY > 0):
-                counters["Counter6"] += 1
+                counters[5] += 1
                 logging.warning(
                     "WARNING6!~%s~%s Height should be > %s; found %s",
                     filepre, name_wo_ext, BASE_H_QUALITY, h
@@ -161,7 +186,7 @@ def test_image(image_path: Path, counters: Dict[str, int]):
 
             # 7) Exact 2000 x 3000
             if not (w == REQUIRED_WIDTH and h == REQUIRED_HEIGHT):
-                counters["Counter7"] += 1
+                counters[6] += 1
                 logging.warning(
                     "WARNING7!~%s~%s Dimensions should be %dx%d; found %dx%d",
                     filepre, name_wo_ext, REQUIRED_WIDTH, REQUIRED_HEIGHT, w, h
@@ -169,6 +194,14 @@ def test_image(image_path: Path, counters: Dict[str, int]):
 
     except Exception as e:
         logging.warning("Open/process error for %s (%s)", filepre, e)
+    return counters
+
+
+def _init_worker(log_queue) -> None:
+    # Workers hand their records to the parent's QueueListener (single writer for the log file)
+    qh = QueueHandler(log_queue)
+    qh.setFormatter(logging.Formatter("%(message)s"))  # parent's handler applies the real format
+    logging.basicConfig(level=logging.INFO, handlers=[qh], force=True)
 
 
 # ---------- File iteration (PNG only) ----------
@@ -187,6 +220,9 @@ def main():
     parser.add_argument("--input_directory", required=True, help="Root folder (recursive, PNG only)")
     args = parser.parse_args()
 
+    # configured here, not at import: pool workers re-import this module and must not truncate the log
+    log_file = setup_logging()
+
     root = Path(args.input_directory)
     if not root.exists():
         print(f"Images location >{root}< not found. Exiting now...")
@@ -197,27 +233,37 @@ def main():
     logging.info("scriptName                   : %s", SCRIPT_PATH.name)
     logging.info("input_directory              : %s", root)
     logging.info("script_path                  : %s", SCRIPT_DIR)
-    logging.info("scriptLog                    : %s", LOG_FILE)
+    logging.info("scriptLog                    : %s", log_file)
 
-    total = sum(1 for _ in iter_png_files(root))
+    paths = list(iter_png_files(root))
+    total = len(paths)
     print(f"Planned scan: {total} PNG files under {root} (recursive)")
 
     start = timer()
-    counters: Dict[str, int] = {f"Counter{i}": 0 for i in range(1, 8)}
+    counters = [0] * N_CHECKS
     processed = 0
 
-    # Console: progress bar only
-    with alive_bar(total or 1, title="Scanning PNGs", dual_line=False, stats=False) as bar:
-        for fp in iter_png_files(root):
-            test_image(fp, counters)
-            processed += 1
-            bar()
+    # Checks are pure CPU per file: run them in worker processes, aggregate counters here
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *logging.getLogger().handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        # Console: progress bar only
+        with alive_bar(total or 1, title="Scanning PNGs", dual_line=False, stats=False) as bar, \
+                ProcessPoolExecutor(initializer=_init_worker, initargs=(log_queue,)) as pool:
+            for local in pool.map(test_image, paths, chunksize=8):
+                for i, v in enumerate(local):
+                    counters[i] += v
+                processed += 1
+                bar()
+    finally:
+        listener.stop()
 
     # ===== SUMMARY =====
     elapsed_min = round((timer() - start) / 60.0, 2)
     ppm = round((processed / elapsed_min), 2) if elapsed_min > 0 else processed
-    tot_issues = sum(counters.values())
-    tot_checks = processed * 7
+    tot_issues = sum(counters)
+    tot_checks = processed * N_CHECKS
     issues_pct = round(((tot_issues / tot_checks) * 100), 2) if processed > 0 else 0.0
 
     # Log the summary (always written)
@@ -227,13 +273,13 @@ def main():
     logging.info("Elapsed time (min)           : %s", elapsed_min)
     logging.info("Files Processed              : %s", processed)
     logging.info("Posters per minute           : %s", ppm)
-    logging.info("WARNING1 Grayscale Total     : %s", counters['Counter1'])
-    logging.info("WARNING2 Transparent Total   : %s", counters['Counter2'])
-    logging.info("WARNING3 Head Chop Total     : %s", counters['Counter3'])
-    logging.info("WARNING4 Image Ratio Total   : %s", counters['Counter4'])
-    logging.info("WARNING5 Quality W Total     : %s", counters['Counter5'])
-    logging.info("WARNING6 Quality H Total     : %s", counters['Counter6'])
-    logging.info("WARNING7 2000x3000 Total     : %s", counters['Counter7'])
+    logging.info("WARNING1 Grayscale Total     : %s", counters[0])
+    logging.info("WARNING2 Transparent Total   : %s", counters[1])
+    logging.info("WARNING3 Head Chop Total     : %s", counters[2])
+    logging.info("WARNING4 Image Ratio Total   : %s", counters[3])
+    logging.info("WARNING5 Quality W Total     : %s", counters[4])
+    logging.info("WARNING6 Quality H Total     : %s", counters[5])
+    logging.info("WARNING7 2000x3000 Total     : %s", counters[6])
     logging.info("Total issues                 : %s", tot_issues)
     logging.info("Total checks                 : %s", tot_checks)
     logging.info("Percent Issues               : %s %%", issues_pct)
@@ -243,11 +289,11 @@ def main():
     print("\n=== SUMMARY ===")
     print(f"Processed: {processed}  |  Elapsed: {elapsed_min} min  |  PPM: {ppm}")
     print(
-        f"W1 Gray: {counters['Counter1']} | W2 NotTransparent: {counters['Counter2']} | W3 HeadChop: {counters['Counter3']}")
+        f"W1 Gray: {counters[0]} | W2 NotTransparent: {counters[1]} | W3 HeadChop: {counters[2]}")
     print(
-        f"W4 Ratio: {counters['Counter4']} | W5 Width: {counters['Counter5']} | W6 Height: {counters['Counter6']} | W7 2000x3000: {counters['Counter7']}")
+        f"W4 Ratio: {counters[3]} | W5 Width: {counters[4]} | W6 Height: {counters[5]} | W7 2000x3000: {counters[6]}")
     print(f"Issues: {tot_issues} / Checks: {tot_checks}  ({issues_pct}%)")
-    print(f"Details in log → {LOG_FILE}")
+    print(f"Details in log → {log_file}")
 
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 import os
 import re
+import mmap
 import sys
+import json
+import hashlib
 import argparse
 import logging
+from collections import Counter
 from logging import FileHandler, StreamHandler
 from pathlib import Path
 from urllib.parse import unquote
@@ -21,6 +25,15 @@ def ensure_config_dir(script_file: str | Path) -> Path:
 
 
 CONFIG_DIR = ensure_config_dir(__file__)
+CACHE_DIR = CONFIG_DIR / "cache"
+README_URL = "https://raw.githubusercontent.com/Kometa-Team/People-Images-rainier/master/README.md"
+# Lines with "Collection Warning: No Poster Found at" (compiled once)
+# old repo: https://raw.githubusercontent.com/meisnate12/Plex-Meta-Manager-People(.+?)\s+
+# Bytes pattern: it runs straight over the mmapped log (no decoded copy of the file)
+WARNING_PREFIX = b"Collection Warning: No Poster Found at https://raw.githubusercontent.com/Kometa-Team/People-Images"
+WARNING_RE = re.compile(re.escape(WARNING_PREFIX) + rb'(\S+)')
+# Poster links in that README: [Name](https://raw.githubusercontent.com/.../Name.jpg)
+README_LINK = re.compile(r"\[([^\]]+)\]\((https://raw\.githubusercontent\.com/[^)\s]+)\)")
 
 
 # --- logging goes to <scriptdir>/config/logs/<scriptname>.log ---
@@ -44,12 +57,62 @@ def setup_logging(level=logging.INFO, console=True):
 
 
 # ---------- core logic ----------
+def cached_get(url: str, timeout: int = 30) -> str:
+    """
+    GET a text resource, keeping a copy under <config>/cache and revalidating it with
+    If-None-Match / If-Modified-Since; a 304 returns the cached text without a download.
+    Raises requests.RequestException on failure.
+    """
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+    body_path = CACHE_DIR / f"{key}.txt"
+    meta_path = CACHE_DIR / f"{key}.json"
+    headers = {}
+    if body_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = requests.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and headers:
+        logging.info("README unchanged (304) → using cached copy %s", body_path)
+        return body_path.read_text(encoding="utf-8")
+    response.raise_for_status()
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        body_path.write_text(response.text, encoding="utf-8")
+        meta_path.write_text(json.dumps({
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }), encoding="utf-8")
+    except OSError as e:
+        logging.warning("Could not cache %s: %s", url, e)
+    return response.text
+
+
+def parse_readme_names(text: str) -> set[str]:
+    """Poster names from README links: each link label plus its URL-decoded file stem."""
+    names: set[str] = set()
+    for label, url in README_LINK.findall(text):
+        names.add(label.strip())
+        stem = extract_filename_from_url(url)
+        if stem:
+            names.add(stem)
+    return names
+
+
 def extract_filename_from_url(url):
     return unquote(os.path.splitext(os.path.basename(url))[0])
 
 
 def scan_text_files(folder_path):
-    hits = {}
+    hits: Counter[str] = Counter()
     online_names = set()
 
     # Get the list of acceptable extensions
@@ -62,27 +125,24 @@ def scan_text_files(folder_path):
     def is_acceptable_file(file):
         return file_name_regex.search(file) and any(file.lower().endswith(ext) for ext in acceptable_extensions)
 
-    # Regular expression to find lines with "Collection Warning: No Poster Found at"
-    # warning_regex = r'Collection Warning: No Poster Found at https://raw\.githubusercontent\.com/meisnate12/Plex-Meta-Manager-People(.+?)\s+'
-    warning_regex = r'Collection Warning: No Poster Found at https://raw\.githubusercontent\.com/Kometa-Team/People-Images(.+?)\s+'
-
     for root, _, files in os.walk(folder_path):
         for file in files:
             file_path = os.path.join(root, file)
             if is_acceptable_file(file):
                 logging.info(f"Scanning {file_path}")
                 print(f"Scanning {file_path}")
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                    # with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    #     content = f.read()
-                    matches = re.findall(warning_regex, content)
-                    if matches:
-                        for match in matches:
-                            decoded_filename = extract_filename_from_url(match)
-                            hits[decoded_filename] = hits.get(decoded_filename, 0) + 1
-                        logging.info(f"Processed {file_path}, found {len(matches)} hits.")
-                        print(f"Processed {file_path}, found {len(matches)} hits.")
+                found = 0
+                # mmap: the regex scans the page cache directly (literal-prefix search, no per-line
+                # Python loop, no userspace copy); empty files can't be mapped
+                if os.path.getsize(file_path) > 0:
+                    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        for m in WARNING_RE.finditer(mm):
+                            match = m.group(1).decode('utf-8', errors='replace')
+                            hits[extract_filename_from_url(match)] += 1
+                            found += 1
+                if found:
+                    logging.info(f"Processed {file_path}, found {found} hits.")
+                    print(f"Processed {file_path}, found {found} hits.")
 
     sorted_hits = sorted(hits.items(), key=lambda x: x[0])
 
@@ -93,9 +153,8 @@ def scan_text_files(folder_path):
             online_names.add(name)
 
     # Fetch the online content once
-    online_content = requests.get(
-        "https://raw.githubusercontent.com/Kometa-Team/People-Images-rainier/master/README.md").text
-    not_found_names = set(name for name in online_names if name not in online_content)
+    online_content = cached_get(README_URL)
+    not_found_names = online_names - parse_readme_names(online_content)
 
     not_found_path = CONFIG_DIR / "people_list.txt"
     with not_found_path.open("w", encoding="utf-8") as f:
@@ -52,6 +52,12 @@ Common CLI usage
   python orchestrator.py --force      # ignore checkpoints and run all steps
   python orchestrator.py --list       # show step status & which step would run next
   python orchestrator.py --redo readme  # re-run from "readme": clears its checkpoint and those after
+  python orchestrator.py --sequential # one step at a time (otherwise a step starts once its inputs are done)
+  python orchestrator.py --isolate    # fresh interpreter per step (python steps otherwise share warm workers)
+  python orchestrator.py -v           # also print each step's command line
+  python orchestrator.py --continue-on-failure  # keep running steps that don't depend on a failed one
+  python orchestrator.py --dry-run    # print the commands that would run; runs, checks and writes nothing
+  python orchestrator.py --max-concurrency 2 --events-file run.jsonl  # cap overlap; stream start/end events
 
 Environment (./config/.env or process environment)
 --------------------------------------------------
@@ -72,15 +78,37 @@ Environment (./config/.env or process environment)
   # Hard requirements (not optional once set to true)
   ORCH_REQUIRE_POWERSHELL=true        — fail if PowerShell isn't available
   ORCH_REQUIRE_BG_OUTPUT=true         — fail if SEL_DOWNLOAD_DIR isn't set/visible
+
+  # Output
+  ORCH_LOG=WARNING      — hide the orchestrator's step banners (default: INFO)
+
+  # Tool paths (filled in from PATH once per run when unset; steps use them instead of searching PATH)
+  GIT_BIN               — git executable used by update_people_repos.py / auto_readme.py
+  CHROMEDRIVER_BIN      — chromedriver used by sel_remove_bg.py (unset: Selenium locates one)
+  ORCH_SSH_MULTIPLEX    — "true" to share one SSH connection across git fetch/push (POSIX; default: false;
+                          skipped when GIT_SSH_COMMAND, GIT_SSH or core.sshCommand is set)
 """
+import io
 import os
+import asyncio
 import sys
 import shlex
+import shutil
 import json
 import time
+import runpy
+import logging
+import contextlib
 import subprocess
+import traceback
 import re
+import itertools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -89,14 +117,64 @@ try:
 except Exception:
     load_dotenv = None
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import hyperscan  # optional: scans the log signal sets in one DFA pass
+except Exception:
+    hyperscan = None
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 CONFIG_DIR = SCRIPT_DIR / "config"
 STATE_DIR = CONFIG_DIR / ".orch"           # checkpoint folder
-LOCK_FILE = STATE_DIR / "run.lock"         # run lock to prevent concurrent runs
+LOCK_FILE = STATE_DIR / "run.lock"         # OS-locked while a run is active (holder's pid inside)
+PS_EXE_CACHE = STATE_DIR / "ps_exe.txt"     # PowerShell found by an earlier run
+MANIFEST = STATE_DIR / "manifest.json"      # per-step summary of the last run, for other tools
 
 # For basic repo sanity after ensure_repo
 CATEGORY_DIRS = ["bw", "diiivoy", "diiivoycolor", "rainier", "original", "signature", "transparent"]
 
+# Category repos fetched/pushed at once by update_people_repos.py (network-bound, independent repos)
+GIT_JOBS = len(CATEGORY_DIRS)  # waits on the network, not the CPU: one per repo
+
+# Category trees copied at once by sync_people_images.py (I/O-bound)
+SYNC_JOBS = min(16, 2 * (os.cpu_count() or 1), len(CATEGORY_DIRS))
+
+# Earlier steps whose output each step reads. A step starts once these are done, alongside any
+# other step that is ready too (see step_batches); checks and checkpoints still follow the fixed order.
+DEPENDENCIES: dict[str, set[str]] = {
+    "ensure_repo": set(),
+    "name_check":  set(),                       # reads the Kometa logs; writes config/people_list.txt
+    "missing":     set(),                       # reads the Kometa logs (and the repo's online listing)
+    "tmdb":        {"name_check", "missing"},   # downloads the names in people_list.txt
+    "truncate":    {"tmdb"},
+    "missing_dir": {"truncate"},
+    "prep_dirs":   {"missing_dir"},
+    "remove_bg":   {"prep_dirs"},
+    "poster_ps1":  {"remove_bg"},
+    # update reads no poster inputs, but it hard-resets and cleans every category repo: it waits until
+    # the stop-on-zero checks up to remove_bg have passed, then runs alongside poster_ps1
+    "update":      {"ensure_repo", "remove_bg"},
+    "sync_images": {"poster_ps1", "update"},
+    "readme":      {"sync_images"},
+    "sync_md":     {"readme"},
+    "push":        {"ensure_repo", "update", "sync_images", "readme", "sync_md"},
+}
+
+# Steps whose console output is swallowed (only their logs are parsed afterwards)
+CAPTURED_STEPS = {"name_check", "missing"}
+
+# Network-bound steps; --max-concurrency-net caps how many of these run at once
+NET_STEPS = {"tmdb", "remove_bg", "update", "push"}
+
+# Scripts that always get their own interpreter: they run their own process pools (workers unpickle
+# functions from __main__, which runpy doesn't provide) or drive a browser that must not outlive them.
+ISOLATED_SCRIPTS = {"get_missing_people_dir.py", "sel_remove_bg.py", "image_check.py"}
+
 
 def env_path(key: str, default: str | None = None) -> Optional[Path]:
     value = os.getenv(key, default if default is not None else "")
@@ -110,19 +188,70 @@ def _bool_env(key: str, default: bool = False) -> bool:
     return str(v).strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
-def load_env_or_bootstrap() -> None:
-    """Load ./config/.env; if missing, try to copy from .env.example and exit with guidance."""
+@dataclass(frozen=True)
+class OrchEnv:
+    """Every env setting the orchestrator reads, looked up (and paths resolved) once in load_env_or_bootstrap."""
+    logs_dir: Optional[Path]
+    repo_root: Optional[Path]
+    branch: str
+    style: str
+    styles: str
+    commit_message: str
+    git_user_name: str
+    git_user_email: str
+    bg_output_dir: Optional[Path]
+    bg_exts: str
+    continue_if_empty: bool
+    require_powershell: bool
+    require_bg_output: bool
+    tmdb_key_set: bool
+
+    @classmethod
+    def from_environ(cls) -> "OrchEnv":
+        return cls(
+            logs_dir=env_path("ORCH_LOGS_DIR"),
+            repo_root=env_path("PEOPLE_IMAGES_DIR"),
+            branch=os.getenv("PEOPLE_BRANCH", ""),
+            style=os.getenv("ORCH_STYLE", "transparent"),
+            styles=os.getenv("ORCH_STYLES", ""),
+            commit_message=os.getenv("ORCH_COMMIT_MESSAGE", ""),
+            git_user_name=os.getenv("ORCH_GIT_USER_NAME", ""),
+            git_user_email=os.getenv("ORCH_GIT_USER_EMAIL", ""),
+            bg_output_dir=env_path("SEL_DOWNLOAD_DIR"),
+            bg_exts=os.getenv("ORCH_BG_EXTS", "png"),
+            continue_if_empty=_bool_env("ORCH_CONTINUE_IF_EMPTY", False),
+            require_powershell=_bool_env("ORCH_REQUIRE_POWERSHELL", False),
+            require_bg_output=_bool_env("ORCH_REQUIRE_BG_OUTPUT", False),
+            tmdb_key_set=bool(os.getenv("TMDB_KEY")),
+        )
+
+    @cached_property
+    def logs_dir_exists(self) -> bool:
+        # nothing in the run creates the Kometa logs folder, so one stat is enough
+        # (repo_root is not memoized: ensure_repo may clone it mid-run)
+        return bool(self.logs_dir and self.logs_dir.exists())
+
+
+def load_env_or_bootstrap(dry_run: bool = False) -> OrchEnv:
+    """
+    Load ./config/.env (if missing, try to copy from .env.example and exit with guidance); return the settings.
+    dry_run: only read — no .env bootstrap, no state folder, nothing exported for steps that won't run.
+    """
+    env_file = CONFIG_DIR / ".env"
+    if dry_run:
+        if not env_file.exists():
+            print(f"[WARN] Missing {env_file}; planning with the process environment only.", file=sys.stderr)
+        elif load_dotenv:
+            load_dotenv(env_file)
+        return OrchEnv.from_environ()
     if load_dotenv:
-        env_file = CONFIG_DIR / ".env"
         if not env_file.exists():
             example = CONFIG_DIR / ".env.example"
             try:
                 example_src = SCRIPT_DIR / ".env.example"  # fallback at repo root
-                content = (example.read_text(encoding="utf-8")
-                           if example.exists()
-                           else example_src.read_text(encoding="utf-8"))
                 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-                env_file.write_text(content, encoding="utf-8")
+                # byte copy (sendfile on Linux); no decode/encode round trip
+                shutil.copyfile(example if example.exists() else example_src, env_file)
             except Exception:
                 pass
             print(f"Missing ./config/.env — created one from example.\n"
@@ -130,30 +259,115 @@ def load_env_or_bootstrap() -> None:
                   file=sys.stderr)
             sys.exit(1)
         load_dotenv(env_file)
+        # an earlier version cached the parsed .env here (secrets included, in plain text); don't leave it behind
+        (CONFIG_DIR / ".env.cache.json").unlink(missing_ok=True)
+    # the one place the state folder is created; every later write (lock, checkpoints, caches) assumes it
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    _export_tool_paths()
+    _export_ssh_multiplexing()
+    return OrchEnv.from_environ()
+
+
+def _export_tool_paths() -> None:
+    """Look git/chromedriver up on PATH once and hand the absolute paths to every step via the environment."""
+    for var, tool in (("GIT_BIN", "git"), ("CHROMEDRIVER_BIN", "chromedriver")):
+        if not os.environ.get(var):
+            found = shutil.which(tool)
+            if found:
+                os.environ[var] = found
+
+
+def _export_ssh_multiplexing() -> None:
+    """
+    Opt-in (ORCH_SSH_MULTIPLEX=true): update and push talk to the same git host once per category repo;
+    over SSH, share one connection (ControlMaster) across all of them instead of a handshake per fetch/push.
+    Left alone off POSIX, and whenever the user already chose how git runs ssh (GIT_SSH_COMMAND, GIT_SSH
+    or core.sshCommand in their git config), since GIT_SSH_COMMAND would override those.
+    The socket lives in a private (0700, owned by us) ~/.ssh/kometa-cm, never in shared /tmp.
+    """
+    if (os.name != "posix" or not _bool_env("ORCH_SSH_MULTIPLEX", False)
+            or os.environ.get("GIT_SSH_COMMAND") or os.environ.get("GIT_SSH")):
+        return
+    try:
+        cp = subprocess.run([os.environ.get("GIT_BIN") or "git", "config", "--get", "core.sshCommand"],
+                            cwd=str(Path.home()), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        if cp.stdout.strip():
+            return
+        sock_dir = Path.home() / ".ssh" / "kometa-cm"
+        sock_dir.parent.mkdir(mode=0o700, exist_ok=True)  # as ssh would create ~/.ssh
+        sock_dir.mkdir(mode=0o700, exist_ok=True)
+        st = sock_dir.stat()
+    except OSError:
+        return
+    # someone else's or group/world-accessible folder: don't put a socket there
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        print(f"[WARN] {sock_dir} is not private (0700, ours); not sharing SSH connections.", file=sys.stderr)
+        return
+    control_path = f"{sock_dir}/%C"  # %C: 40-char hash of host/port/user; socket paths max out near 104 bytes
+    if len(control_path) + 38 > 100:
+        return
+    os.environ["GIT_SSH_COMMAND"] = ("ssh -o ControlMaster=auto -o ControlPersist=60 "
+                                     f"-o ControlPath={shlex.quote(control_path)}")
 
 
+@lru_cache(maxsize=None)  # asked by preflight and by the poster_ps1 builder
 def ps_exe() -> Optional[str]:
-    """Find a usable PowerShell executable, preferring pwsh (Core)."""
+    """
+    Find a usable PowerShell executable, preferring pwsh (Core).
+    Probing starts PowerShell (slow to cold-start), so the winner is remembered in PS_EXE_CACHE
+    and reused while it is still executable.
+    """
+    try:
+        cached = PS_EXE_CACHE.read_text(encoding="utf-8").strip()
+        if cached and os.access(cached, os.X_OK):
+            return cached
+    except OSError:
+        pass
     candidates = ["pwsh"]
     if sys.platform.startswith("win"):
         candidates += ["powershell", "powershell.exe"]
-    for exe in candidates:
+    # not on PATH: no need to start anything to find that out ("powershell" and "powershell.exe" are one file)
+    paths = list(dict.fromkeys(p for p in map(shutil.which, candidates) if p))
+    if not paths:
+        return None
+
+    def _probe(path: str) -> bool:
         try:
-            cp = subprocess.run([exe, "-NoLogo", "-NoProfile", "-Command", "$PSVersionTable.PSVersion.Major"],
-                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            if cp.returncode == 0:
-                return exe
+            cp = subprocess.run([path, "-NoLogo", "-NoProfile", "-Command", "$PSVersionTable.PSVersion.Major"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
         except Exception:
-            continue
+            return False
+        return cp.returncode == 0
+
+    # Cold starts overlap; the first working candidate in preference order wins
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        ok = list(pool.map(_probe, paths))
+    for path, good in zip(paths, ok):
+        if good:
+            try:
+                tmp = PS_EXE_CACHE.with_suffix(".tmp")
+                tmp.write_text(path, encoding="utf-8")
+                tmp.replace(PS_EXE_CACHE)
+            except OSError:
+                pass
+            return path
     return None
 
 
 # ---------- helpers: run, markers, fs/log counting, lock ----------
-def write_marker(marker: Path, meta: dict) -> None:
-    marker.parent.mkdir(parents=True, exist_ok=True)
-    tmp = marker.with_suffix(marker.suffix + ".tmp")
-    tmp.write_text(json.dumps(meta, indent=2, ensure_ascii=False), encoding="utf-8")
-    tmp.replace(marker)
+def write_marker(marker: Path, meta: dict, atomic: bool = False) -> None:
+    """
+    Write a small JSON state file, in place unless atomic (temp file + rename); files other tools read
+    (the manifest) are written atomically.
+    """
+    data = json.dumps(meta, indent=2, ensure_ascii=False).encode("utf-8")
+    if atomic:
+        tmp = marker.with_suffix(marker.suffix + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(marker)
+    else:
+        with open(marker, "wb") as f:
+            f.write(data)
 
 
 def clear_from(step_keys: List[str], from_key: str) -> None:
@@ -163,23 +377,206 @@ def clear_from(step_keys: List[str], from_key: str) -> None:
         if k == from_key:
             do_clear = True
         if do_clear:
-            mp = STATE_DIR / f"{k}.done.json"
-            if mp.exists():
-                try:
-                    mp.unlink()
-                except Exception:
-                    pass
+            try:
+                (STATE_DIR / f"{k}.done.json").unlink()  # no exists() probe first
+            except OSError:
+                pass
+
+
+def done_markers() -> frozenset:
+    """Names of the checkpoint files present, from one directory read (instead of a stat per step)."""
+    try:
+        return frozenset(e.name for e in os.scandir(STATE_DIR))
+    except FileNotFoundError:
+        return frozenset()
+
 
+# Echo each step's full command line (set by --verbose)
+SHOW_ARGV = False
 
-def marker_exists(marker: Optional[Path]) -> bool:
-    return bool(marker and marker.exists())
+# Open --events-file (JSON lines), or None
+EVENTS_FH = None
+
+
+def emit_event(step: str, phase: str, rc: Optional[int] = None, **extra) -> None:
+    """Append one {"ts", "step", "phase": start|end, "rc"} line to --events-file for external watchers."""
+    if EVENTS_FH is None:
+        return
+    rec = {"ts": time.time(), "step": step, "phase": phase}
+    if rc is not None:
+        rec["rc"] = rc
+    rec.update(extra)
+    EVENTS_FH.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    EVENTS_FH.flush()
+
+
+# Orchestrator's own messages (step banners, launch errors); ORCH_LOG=WARNING hides the banners
+log = logging.getLogger("orch")
+
+
+def setup_logging() -> None:
+    """Banners (INFO) go to stdout, problems (WARNING+) to stderr, as plain messages; level from ORCH_LOG."""
+    level = logging.getLevelName(os.getenv("ORCH_LOG", "INFO").strip().upper())
+    log.setLevel(level if isinstance(level, int) else logging.INFO)
+    log.propagate = False
+    out = logging.StreamHandler(sys.stdout)
+    out.addFilter(lambda rec: rec.levelno < logging.WARNING)
+    err = logging.StreamHandler(sys.stderr)
+    err.setLevel(logging.WARNING)
+    for h in (out, err):
+        h.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(h)
+
+
+def print_banner(title: str, argv: List[str]) -> None:
+    # one record so headers of steps started together don't interleave;
+    # the quoted command line is only built when it will be shown
+    if SHOW_ARGV:
+        log.info("\n=== %s ===\n→ %s", title, shlex.join(argv))
+    else:
+        log.info("\n=== %s ===", title)
+
+
+# ---------- warm step workers (python steps run in-process; --isolate turns this off) ----------
+_STEP_POOL: Optional[ProcessPoolExecutor] = None
+
+# Live output of steps started together: workers put (token, "out"|"err", line) on _STEP_OUT_Q, and
+# (token, None, None) once the step is done; a relay thread in the parent hands lines to _STEP_SINKS[token].
+_STEP_OUT_Q = None
+_STEP_SINKS: dict = {}
+_STEP_SINKS_LOCK = threading.Lock()
+_STEP_TOKENS = itertools.count(1)
+
+
+def _step_worker_init(out_q=None) -> None:
+    global _STEP_OUT_Q
+    _STEP_OUT_Q = out_q
+    os.chdir(SCRIPT_DIR)
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+
+class _QueueWriter(io.TextIOBase):
+    """Worker-side stdout/stderr: each complete line goes to the parent as soon as it is written."""
+
+    def __init__(self, token: int, stream: str):
+        super().__init__()
+        self._token, self._stream, self._buf = token, stream, ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        self._buf += s
+        if "\n" in self._buf:
+            *lines, self._buf = self._buf.split("\n")
+            for ln in lines:
+                _STEP_OUT_Q.put((self._token, self._stream, ln + "\n"))
+        return len(s)
+
+    def drain(self) -> None:
+        if self._buf:
+            _STEP_OUT_Q.put((self._token, self._stream, self._buf))
+            self._buf = ""
+
+
+def _reset_logging() -> None:
+    """Close every handler a previous script installed (flushes its log before the parent parses it)."""
+    loggers = [logging.getLogger()] + [lg for lg in logging.Logger.manager.loggerDict.values()
+                                       if isinstance(lg, logging.Logger)]
+    for lg in loggers:
+        for h in lg.handlers[:]:
+            lg.removeHandler(h)
+            h.close()
+
+
+def _run_script_in_worker(argv: List[str], capture: bool,
+                          token: Optional[int] = None) -> Tuple[int, Optional[str], Optional[str]]:
+    """
+    Pool task: run argv[1] (a script next to this one) as __main__ with argv[2:], mirroring what the
+    subprocess would do — SystemExit code becomes rc, an uncaught exception prints a traceback and gives 1.
+    Modules the scripts import (requests, Pillow, dotenv, ...) stay loaded in the worker for the next step.
+    With a token, output is streamed to the parent line by line instead (see _STEP_OUT_Q).
+    """
+    if token is not None:
+        out, err = _QueueWriter(token, "out"), _QueueWriter(token, "err")
+    else:
+        out, err = io.StringIO(), io.StringIO()
+    rc = 0
+    _reset_logging()
+    sys.argv = argv[1:]
+    with contextlib.ExitStack() as stack:
+        if capture or token is not None:
+            stack.enter_context(contextlib.redirect_stdout(out))
+            stack.enter_context(contextlib.redirect_stderr(err))
+        try:
+            runpy.run_path(str(SCRIPT_DIR / argv[1]), run_name="__main__")
+        except SystemExit as e:
+            if e.code is None:
+                rc = 0
+            elif isinstance(e.code, int):
+                rc = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                rc = 1
+        except Exception:
+            traceback.print_exc()
+            rc = 1
+        finally:
+            _reset_logging()
+            sys.stdout.flush()
+            sys.stderr.flush()
+    if token is not None:
+        out.drain()
+        err.drain()
+        _STEP_OUT_Q.put((token, None, None))  # after every line: the parent waits for this
+        return rc, None, None
+    return rc, (out.getvalue() if capture else None), (err.getvalue() if capture else None)
+
+
+def _relay_step_output(out_q) -> None:
+    """Parent thread: deliver worker lines to the step they belong to, until the None sentinel."""
+    while True:
+        msg = out_q.get()
+        if msg is None:
+            return
+        token, stream, text = msg
+        with _STEP_SINKS_LOCK:
+            sink = _STEP_SINKS.get(token)
+        if sink is not None:
+            sink(stream, text)
+
+
+def start_step_pool(workers: int) -> None:
+    """Long-lived spawn workers for python steps; spawn keeps each worker free of the parent's state."""
+    global _STEP_POOL, _STEP_OUT_Q
+    ctx = multiprocessing.get_context("spawn")
+    _STEP_OUT_Q = ctx.Queue()
+    threading.Thread(target=_relay_step_output, args=(_STEP_OUT_Q,), daemon=True).start()
+    _STEP_POOL = ProcessPoolExecutor(max_workers=max(1, workers), mp_context=ctx,
+                                     initializer=_step_worker_init, initargs=(_STEP_OUT_Q,))
+
+
+def stop_step_pool() -> None:
+    global _STEP_POOL, _STEP_OUT_Q
+    if _STEP_POOL is not None:
+        _STEP_POOL.shutdown()
+        _STEP_POOL = None
+    if _STEP_OUT_Q is not None:
+        _STEP_OUT_Q.put(None)  # ends the relay thread
+        _STEP_OUT_Q = None
+
+
+def _runs_in_pool(argv: List[str]) -> bool:
+    return (_STEP_POOL is not None and len(argv) > 1 and argv[0] == sys.executable
+            and argv[1].endswith(".py") and argv[1] not in ISOLATED_SCRIPTS)
 
 
 def run_cmd(title: str, argv: List[str], capture: bool = False) -> Tuple[int, Optional[str], Optional[str]]:
-    """Run a subprocess; return (rc, stdout, stderr) if capture else (rc, None, None)."""
-    print(f"\n=== {title} ===")
-    print("→", " ".join(shlex.quote(a) for a in argv))
+    """Run a step (warm worker for python scripts, else subprocess); return (rc, stdout, stderr) if capture else (rc, None, None)."""
+    print_banner(title, argv)
     try:
+        if _runs_in_pool(argv):
+            return _STEP_POOL.submit(_run_script_in_worker, argv, capture).result()
         if capture:
             cp = subprocess.run(argv, cwd=str(SCRIPT_DIR), text=True, capture_output=True)
             return cp.returncode, (cp.stdout or ""), (cp.stderr or "")
@@ -187,118 +584,343 @@ def run_cmd(title: str, argv: List[str], capture: bool = False) -> Tuple[int, Op
             cp = subprocess.run(argv, cwd=str(SCRIPT_DIR))
             return cp.returncode, None, None
     except FileNotFoundError as e:
-        print(f"[ERROR] {title}: {e}", file=sys.stderr)
+        log.error("[ERROR] %s: %s", title, e)
+        return 127, None, None
+    except Exception as e:
+        log.error("[ERROR] %s: %s", title, e)
+        return 1, None, None
+
+
+async def _pump(stream: asyncio.StreamReader, title: str, sink: Optional[List[str]], echo: bool, file) -> None:
+    """Copy a child's stream line by line: optionally to the console with a [title] prefix, optionally into sink."""
+    while True:
+        try:
+            line = await stream.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            line = e.partial  # last line without a newline; b"" at EOF
+        except asyncio.LimitOverrunError as e:
+            line = await stream.read(e.consumed)  # over-long line: pass it on in limit-sized pieces
+        if not line:
+            break
+        text = line.decode("utf-8", errors="replace")
+        if sink is not None:
+            sink.append(text)
+        if echo:
+            print(f"[{title}] {text}", end="" if text.endswith("\n") else "\n", file=file, flush=True)
+
+
+async def run_cmd_async(title: str, argv: List[str], capture: bool = False,
+                        echo: bool = True) -> Tuple[int, Optional[str], Optional[str]]:
+    """
+    Concurrent variant of run_cmd for steps started together: the child's stdout/stderr are read
+    as they arrive and echoed with a [title] prefix so interleaved output stays readable.
+    In-process (warm worker) steps stream their lines back the same way (see _STEP_OUT_Q).
+    """
+    print_banner(title, argv)
+    try:
+        if _runs_in_pool(argv):
+            lines: dict = {"out": [], "err": []}
+            done = threading.Event()
+
+            def sink(stream: Optional[str], text: Optional[str]) -> None:
+                if stream is None:
+                    done.set()
+                    return
+                if capture:
+                    lines[stream].append(text)
+                if echo:
+                    print(f"[{title}] {text}", end="" if text.endswith("\n") else "\n",
+                          file=sys.stdout if stream == "out" else sys.stderr, flush=True)
+
+            token = next(_STEP_TOKENS)
+            with _STEP_SINKS_LOCK:
+                _STEP_SINKS[token] = sink
+            try:
+                rc, _, _ = await asyncio.wrap_future(_STEP_POOL.submit(_run_script_in_worker, argv, False, token))
+                # the result can overtake the last lines on the queue; the sentinel comes after them
+                await asyncio.get_running_loop().run_in_executor(None, done.wait, 10.0)
+            finally:
+                with _STEP_SINKS_LOCK:
+                    _STEP_SINKS.pop(token, None)
+            return (rc, "".join(lines["out"]) if capture else None, "".join(lines["err"]) if capture else None)
+
+        proc = await asyncio.create_subprocess_exec(
+            *argv, cwd=str(SCRIPT_DIR),
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            limit=1 << 20,  # progress bars can write long \r-joined "lines"
+        )
+        out_lines: Optional[List[str]] = [] if capture else None
+        err_lines: Optional[List[str]] = [] if capture else None
+        try:
+            await asyncio.gather(
+                _pump(proc.stdout, title, out_lines, echo, sys.stdout),
+                _pump(proc.stderr, title, err_lines, echo, sys.stderr),
+            )
+        except BaseException:
+            # nobody drains the pipes any more: don't leave the child blocked on them while later steps start
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+            raise
+        rc = await proc.wait()
+        return (rc,
+                "".join(out_lines) if out_lines is not None else None,
+                "".join(err_lines) if err_lines is not None else None)
+    except FileNotFoundError as e:
+        log.error("[ERROR] %s: %s", title, e)
         return 127, None, None
     except Exception as e:
-        print(f"[ERROR] {title}: {e}", file=sys.stderr)
+        log.error("[ERROR] %s: %s", title, e)
         return 1, None, None
 
 
+async def run_batch_async(runs: List[Tuple[str, str, List[str], bool]], max_concurrency: int,
+                          max_concurrency_net: int) -> List[Tuple[int, Optional[str], Optional[str]]]:
+    """
+    Run (key, title, argv, quiet[, event extras]) commands concurrently; quiet ones are captured instead
+    of echoed. At most max_concurrency run at once, and at most max_concurrency_net of the NET_STEPS.
+    """
+    limit = asyncio.Semaphore(max(1, max_concurrency))
+    net_limit = asyncio.Semaphore(max(1, max_concurrency_net))
+
+    async def one(key: str, title: str, argv: List[str], quiet: bool, extra: Optional[dict] = None):
+        async with limit, (net_limit if key in NET_STEPS else contextlib.nullcontext()):
+            emit_event(key, "start", **(extra or {}))
+            result = await run_cmd_async(title, argv, capture=quiet, echo=not quiet)
+            emit_event(key, "end", rc=result[0], **(extra or {}))
+            return result
+
+    return list(await asyncio.gather(*(one(*r) for r in runs)))
+
+
+def step_batches(keys: List[str]) -> List[List[str]]:
+    """
+    Group step keys (already in fixed order) into waves over the DEPENDENCIES graph: each step joins the
+    first wave after all of its dependencies, so it starts as soon as its inputs exist instead of waiting
+    for its fixed-order predecessor. Dependencies outside `keys` (already done) don't hold a step back.
+    Within a wave keys keep the fixed order.
+    """
+    wave: dict[str, int] = {}
+    for k in keys:
+        wave[k] = 1 + max((wave[d] for d in DEPENDENCIES.get(k, set()) if d in wave), default=-1)
+    batches: List[List[str]] = [[] for _ in range(max(wave.values(), default=-1) + 1)]
+    for k in keys:
+        batches[wave[k]].append(k)
+    return batches
+
+
+_LOCK_FD: Optional[int] = None
+
+
 def acquire_lock() -> None:
-    STATE_DIR.mkdir(parents=True, exist_ok=True)
-    if LOCK_FILE.exists():
-        print("[ERROR] Another orchestrator run appears to be in progress (lock file present).", file=sys.stderr)
-        print(f"If you're sure no other run is active, delete: {LOCK_FILE}", file=sys.stderr)
+    """
+    Take an exclusive OS lock on LOCK_FILE (flock / msvcrt.locking). Check and take are one call, and the
+    OS drops the lock when the holder exits, so a crashed run never leaves a stale lock behind.
+    """
+    global _LOCK_FD
+    fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        try:
+            holder = os.read(fd, 200).decode("utf-8", errors="replace").strip()
+        except OSError:
+            holder = ""
+        os.close(fd)
+        print("[ERROR] Another orchestrator run is in progress" + (f" ({holder})." if holder else "."),
+              file=sys.stderr)
         sys.exit(3)
-    LOCK_FILE.write_text(f"{os.getpid()} @ {datetime.now().isoformat()}", encoding="utf-8")
+    # who holds it — informational only (shown to a second run)
+    os.ftruncate(fd, 0)
+    os.write(fd, f"{os.getpid()} @ {datetime.now().isoformat()}".encode("utf-8"))
+    _LOCK_FD = fd
 
 
 def release_lock() -> None:
-    try:
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
-    except Exception:
-        pass
+    global _LOCK_FD
+    if _LOCK_FD is not None:
+        os.close(_LOCK_FD)  # closing the descriptor drops the lock; the file itself stays
+        _LOCK_FD = None
+
 
+def keep_lock_across_exec(keep: bool = True) -> None:
+    """Let an exec'd final step inherit the locked descriptor, so the run stays locked until it exits."""
+    if _LOCK_FD is not None:
+        os.set_inheritable(_LOCK_FD, keep)
 
-def count_recent_files(paths: list[Path], since_ts: float, suffixes: set[str] | None = None) -> int:
+
+def count_recent_files(paths: list[Path], since_ts: float, suffixes: set[str] | None = None,
+                       limit: Optional[int] = None) -> int:
+    # os.scandir walk: file type comes with the directory listing, and files with other
+    # suffixes are skipped before any stat. With limit, stops counting once it is reached.
+    cutoff = since_ts - 1.0
     total = 0
     for base in paths:
-        if not base or not base.exists():
+        if not base:
             continue
-        for p in base.rglob("*"):
-            if not p.is_file():
-                continue
-            if suffixes and p.suffix.lower().lstrip(".") not in suffixes:
-                continue
+        stack = [str(base)]
+        while stack:
             try:
-                # Some copy routines preserve mtime; don't rely solely on this for critical steps.
-                if p.stat().st_mtime >= (since_ts - 1.0):
-                    total += 1
+                it = os.scandir(stack.pop())
             except OSError:
-                pass
+                continue
+            with it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                            continue
+                        if not e.is_file():
+                            continue
+                        if suffixes and os.path.splitext(e.name)[1].lower().lstrip(".") not in suffixes:
+                            continue
+                        # Some copy routines preserve mtime; don't rely solely on this for critical steps.
+                        if e.stat().st_mtime >= cutoff:
+                            total += 1
+                            if limit is not None and total >= limit:
+                                return total
+                    except OSError:
+                        pass
     return total
 
 
-def parse_zero_from_log(logfile: Path) -> Optional[bool]:
+# Log signals, compiled once; each set is one alternation so a log is scanned once per set
+_ZERO_PATTERNS = [
+    r"\b0\s+(?:items|people|names|downloads|moved|copied)\b",
+    r"\bno\s+(?:items|people|names|downloads|changes|work)\b",
+    r"\bnothing\s+(?:to\s+do|moved|copied|processed)\b",
+    r"\bSummary:\s*processed\s*=\s*0\b",
+    r"\bFiles processed:\s*0\b",
+]
+_NONZERO_PATTERNS = [
+    r"\b[1-9]\d*\s+(?:items|people|names|downloads|moved|copied)\b",
+    r"\b(?:total|processed|moved|copied)\s*:\s*[1-9]\d*\b",
+    r"\bSummary:\s*processed\s*=\s*[1-9]\d*\b",
+    r"\bFiles processed:\s*[1-9]\d*\b",
+]
+_ZERO_RE = re.compile("|".join(_ZERO_PATTERNS), re.I)
+_NONZERO_RE = re.compile("|".join(_NONZERO_PATTERNS), re.I)
+_COPIED_RE = re.compile(r"copied\s*=\s*(\d+)")
+_MISSING_DIR_SUMMARY_RE = re.compile(r"Summary:\s*processed\s*=\s*(\d+)", re.I)
+_PROCESSED_RE = re.compile(r"\bprocessed\s*=\s*(\d+)", re.I)
+_FILES_PROCESSED_RE = re.compile(r"Files processed:\s*(\d+)", re.I)
+
+
+@lru_cache(maxsize=None)
+def _signal_db():
+    """Both signal sets in one Hyperscan database (id 0 = zero, 1 = non-zero); None if unavailable."""
+    if hyperscan is None:
+        return None
+    pats = [(p, 0) for p in _ZERO_PATTERNS] + [(p, 1) for p in _NONZERO_PATTERNS]
+    try:
+        db = hyperscan.Database()
+        db.compile(expressions=[p.encode() for p, _ in pats], ids=[i for _, i in pats],
+                   elements=len(pats), flags=[hyperscan.HS_FLAG_CASELESS] * len(pats))
+        return db
+    except Exception as e:  # unsupported CPU / pattern: stay on re
+        log.debug("hyperscan unavailable (%s); using re", e)
+        return None
+
+
+def _log_is_fresh(logfile: Path, since: float = 0.0) -> bool:
+    """
+    True if the log exists and was written after `since` (the step's start). A log the step didn't touch
+    is the previous run's, so its counts say nothing about this one. 2s slack for coarse-mtime filesystems.
+    """
+    try:
+        return logfile.stat().st_mtime >= since - 2.0
+    except OSError:
+        return False
+
+
+def parse_zero_from_log(logfile: Path, since: float = 0.0) -> Optional[bool]:
     """Return True if log strongly indicates zero work; False if >0; None if unknown."""
-    if not logfile.exists():
+    if not _log_is_fresh(logfile, since):
         return None
+    db = _signal_db()
+    if db is not None:
+        try:
+            data = logfile.read_bytes()
+        except Exception:
+            return None
+        hits = set()
+
+        def on_match(sig, _from, _to, _flags, _ctx):
+            hits.add(sig)
+            return sig == 1  # a non-zero signal settles it; stop scanning
+        try:
+            db.scan(data, match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+        return False if 1 in hits else True if 0 in hits else None
     try:
         text = logfile.read_text(encoding="utf-8", errors="ignore")
     except Exception:
         return None
-    # Look for simple signals
-    zero_patterns = [
-        r"\b0\s+(?:items|people|names|downloads|moved|copied)\b",
-        r"\bno\s+(?:items|people|names|downloads|changes|work)\b",
-        r"\bnothing\s+(?:to\s+do|moved|copied|processed)\b",
-        r"\bSummary:\s*processed\s*=\s*0\b",
-        r"\bFiles processed:\s*0\b",
-    ]
-    nonzero_patterns = [
-        r"\b([1-9]\d*)\s+(?:items|people|names|downloads|moved|copied)\b",
-        r"\b(total|processed|moved|copied)\s*:\s*([1-9]\d*)\b",
-        r"\bSummary:\s*processed\s*=\s*([1-9]\d*)\b",
-        r"\bFiles processed:\s*([1-9]\d*)\b",
-    ]
-    for rgx in nonzero_patterns:
-        if re.search(rgx, text, flags=re.I):
-            return False
-    for rgx in zero_patterns:
-        if re.search(rgx, text, flags=re.I):
-            return True
+    # Look for simple signals (any non-zero signal wins over a zero one)
+    if _NONZERO_RE.search(text):
+        return False
+    if _ZERO_RE.search(text):
+        return True
     return None
 
 
-def sum_copied_from_sync_log(logfile: Path) -> Optional[int]:
+def sum_copied_from_sync_log(logfile: Path, since: float = 0.0) -> Optional[int]:
     """Parse sync_people_images.log and sum 'copied=N' across categories. Return None if not parseable."""
-    if not logfile.exists():
+    if not _log_is_fresh(logfile, since):
         return None
     try:
         text = logfile.read_text(encoding="utf-8", errors="ignore")
     except Exception:
         return None
-    copied_values = [int(m) for m in re.findall(r"copied\s*=\s*(\d+)", text)]
+    copied_values = [int(m) for m in _COPIED_RE.findall(text)]
     return sum(copied_values) if copied_values else 0 if "copied=0" in text else None
 
 
-def parsed_processed_from_missing_dir(logfile: Path) -> Optional[int]:
-    """Parse get_missing_people_dir.py log for 'Summary: processed=N'."""
-    if not logfile.exists():
+def _tail(logfile: Path, nbytes: int = 65536) -> str:
+    """Last nbytes of a log (whole lines only), for summaries written at the end of a run."""
+    with open(logfile, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - nbytes))
+        data = f.read()
+    if size > nbytes:
+        data = data.partition(b"\n")[2]  # drop the partial first line
+    return data.decode("utf-8", errors="ignore")
+
+
+def parsed_processed_from_missing_dir(logfile: Path, since: float = 0.0) -> Optional[int]:
+    """Parse get_missing_people_dir.py log for 'Summary: processed=N' (written last, so only the tail is read)."""
+    if not _log_is_fresh(logfile, since):
         return None
     try:
-        text = logfile.read_text(encoding="utf-8", errors="ignore")
+        text = _tail(logfile)
     except Exception:
         return None
-    m = re.search(r"Summary:\s*processed\s*=\s*(\d+)", text, flags=re.I)
+    m = _MISSING_DIR_SUMMARY_RE.search(text)
     if m:
         return int(m.group(1))
     # fallback tokens
-    m2 = re.search(r"\bprocessed\s*=\s*(\d+)", text, flags=re.I)
+    m2 = _PROCESSED_RE.search(text)
     return int(m2.group(1)) if m2 else None
 
 
-def parsed_files_processed_from_remove_bg(logfile: Path) -> Optional[int]:
-    """Parse sel_remove_bg.py log for 'Files processed: N'."""
-    if not logfile.exists():
+def parsed_files_processed_from_remove_bg(logfile: Path, since: float = 0.0) -> Optional[int]:
+    """
+    Parse sel_remove_bg.py log for 'Files processed: N'. That log is appended to across runs,
+    so the last summary in its tail is this run's.
+    """
+    if not _log_is_fresh(logfile, since):
         return None
     try:
-        text = logfile.read_text(encoding="utf-8", errors="ignore")
+        text = _tail(logfile)
     except Exception:
         return None
-    m = re.search(r"Files processed:\s*(\d+)", text, flags=re.I)
-    return int(m.group(1)) if m else None
+    found = _FILES_PROCESSED_RE.findall(text)
+    return int(found[-1]) if found else None
 
 
 # ---------------------- Step registry & helpers ----------------------
@@ -307,7 +929,7 @@ class Step:
         """
         key: stable identifier (used in CLI and checkpoint filenames)
         title: friendly name
-        builder: callable () -> List[str] | None  (argv for subprocess, or None to skip)
+        builder: callable (RunCtx) -> List[str] | None  (argv for subprocess, or None to skip)
         marker: filename under STATE_DIR to mark success (None => never checkpoint)
         always_run: ignore checkpoint (used for cheap validation or volatile ops like git)
         """
@@ -322,9 +944,171 @@ class Step:
         return (STATE_DIR / self.marker) if self.marker else None
 
 
+# ---------------------- Step builders (argv from the run context) ----------------------
+PY = sys.executable
+PS1_PATH = str(SCRIPT_DIR / "create_people_poster.ps1")  # SCRIPT_DIR is already resolved
+
+
+@dataclass(frozen=True)
+class RunCtx:
+    """Settings for one run: OrchEnv with CLI overrides applied, plus the path strings the builders pass on."""
+    env: OrchEnv
+    logs_dir: Optional[Path]
+    logs_ok: bool
+    repo_root: Optional[Path]
+    branch: str
+    styles: Tuple[str, ...]
+    commit_template: str
+    git_user_name: str
+    git_user_email: str
+    bg_output_dir: Optional[Path]
+    require_powershell: bool
+    require_bg_output: bool
+    repo_root_str: str
+    logs_dir_str: str
+    style_dirs: dict
+    style_config_dirs: dict
+    dry_run: bool = False
+
+
+def _missing_input(ctx: RunCtx, msg: str) -> None:
+    """A step can't run without some input: exit 2, or on a dry run warn and keep planning."""
+    if ctx.dry_run:
+        print(f"[WARN] {msg}", file=sys.stderr)
+        return
+    print(f"[ERROR] {msg}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _require_repo_or_die(ctx: RunCtx) -> None:
+    if ctx.dry_run:
+        return  # main() warns once instead
+    if not ctx.repo_root or not ctx.repo_root.exists():
+        print("[ERROR] PEOPLE_IMAGES_DIR not set or invalid; required for this step.", file=sys.stderr)
+        sys.exit(2)
+
+
+def _ensure_repo(ctx: RunCtx):
+    # Let ensure_people_repo.py figure things out (clone/validate)
+    args2 = ["--repo-root", ctx.repo_root_str] if ctx.repo_root else []
+    return [PY, "ensure_people_repo.py"] + args2
+
+
+def _name_check(ctx: RunCtx):
+    if not ctx.logs_ok:
+        _missing_input(ctx, "ORCH_LOGS_DIR not set or missing. Use --logs-dir.")
+    return [PY, "name_checker_dir.py", "--input_directory", ctx.logs_dir_str]
+
+
+def _missing(ctx: RunCtx):
+    if not ctx.logs_ok:
+        _missing_input(ctx, "ORCH_LOGS_DIR not set or missing. Use --logs-dir.")
+    return [PY, "get_missing_people.py", "--input_directory", ctx.logs_dir_str]
+
+
+def _tmdb(ctx: RunCtx):
+    if not ctx.env.tmdb_key_set:
+        _missing_input(ctx, "TMDB_KEY not set in ./config/.env; cannot run tmdb step.")
+    return [PY, "tmdb_people.py"]
+
+
+def _truncate(ctx: RunCtx):
+    return [PY, "truncate_tmdb_people_names.py"]
+
+
+def _missing_dir(ctx: RunCtx):
+    return [PY, "get_missing_people_dir.py"]
+
+
+def _prep_dirs(ctx: RunCtx):
+    return [PY, "prep_people_dirs.py"]
+
+
+def _remove_bg(ctx: RunCtx):
+    # If caller requires output verification but we cannot locate output dir — fail now.
+    if ctx.require_bg_output and not ctx.bg_output_dir:
+        _missing_input(ctx, "ORCH_REQUIRE_BG_OUTPUT is true but SEL_DOWNLOAD_DIR is not set.")
+    return [PY, "sel_remove_bg.py"]
+
+
+def _poster_ps1(ctx: RunCtx):
+    # a dry run only looks PowerShell up on PATH: probing starts it and caches the result
+    ps = (shutil.which("pwsh") or (shutil.which("powershell") if sys.platform.startswith("win") else None)
+          if ctx.dry_run else ps_exe())
+    if not ps:
+        if ctx.require_powershell:
+            _missing_input(ctx, "ORCH_REQUIRE_POWERSHELL=true but PowerShell (pwsh) not found.")
+            return None
+        print("[WARN] PowerShell (pwsh) not found — skipping create_people_poster.ps1", file=sys.stderr)
+        return None
+    return [ps, "-NoLogo", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", PS1_PATH]
+
+
+def _update_repos(ctx: RunCtx):
+    _require_repo_or_die(ctx)
+    args2 = ["--repo-root", ctx.repo_root_str]
+    if ctx.branch:
+        args2 += ["--branch", ctx.branch]
+    args2 += ["--op", "update", "--mode", "hardreset", "--clean-ignored", "--jobs", str(GIT_JOBS)]
+    return [PY, "update_people_repos.py"] + args2
+
+
+def _sync_images(ctx: RunCtx):
+    _require_repo_or_die(ctx)
+    return [PY, "sync_people_images.py", "--dest_root", ctx.repo_root_str, "--jobs", str(SYNC_JOBS)]
+
+
+# Per-style builders (used during the run loop)
+def _auto_readme_for(ctx: RunCtx, style: str):
+    _require_repo_or_die(ctx)
+    return [PY, "auto_readme.py", "--style", style, "--directory", ctx.style_dirs[style]]
+
+
+def _sync_md_for(ctx: RunCtx, style: str):
+    _require_repo_or_die(ctx)
+    return [PY, "sync_md.py", "--src", ctx.style_dirs[style], "--dst", ctx.style_config_dirs[style], "--pattern", "*.md"]
+
+
+def _push_repos(ctx: RunCtx):
+    _require_repo_or_die(ctx)
+    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    styles_tag = ",".join(ctx.styles)
+    msg = (ctx.commit_template or f"chore: sync posters & docs [{styles_tag}] — {now}").strip()
+    args2 = ["--repo-root", ctx.repo_root_str]
+    if ctx.branch:
+        args2 += ["--branch", ctx.branch]
+    args2 += ["--op", "push", "--message", msg]
+    if ctx.git_user_name:
+        args2 += ["--git-user-name", ctx.git_user_name]
+    if ctx.git_user_email:
+        args2 += ["--git-user-email", ctx.git_user_email]
+    args2 += ["--jobs", str(GIT_JOBS)]
+    return [PY, "update_people_repos.py"] + args2
+
+
+# Fixed, enforced order
+STEPS: Tuple[Step, ...] = (
+    Step("ensure_repo", "Validate People-Images repo",          _ensure_repo,   marker=None,              always_run=True),
+    Step("name_check",  "Scan Kometa logs for missing names",   _name_check,    marker="name_check.done.json"),
+    Step("missing",     "Build missing-people lists",           _missing,       marker="missing.done.json"),
+    Step("tmdb",        "Download posters via TMDB",            _tmdb,          marker="tmdb.done.json"),
+    Step("truncate",    "Truncate TMDB person names",           _truncate,      marker="truncate.done.json"),
+    Step("missing_dir", "Dir-based missing discovery",          _missing_dir,   marker="missing_dir.done.json"),
+    Step("prep_dirs",   "Ensure local people_dirs scaffolds",   _prep_dirs,     marker="prep_dirs.done.json"),
+    Step("remove_bg",   "Remove backgrounds (Selenium)",        _remove_bg,     marker="remove_bg.done.json"),
+    Step("poster_ps1",  "Generate posters via PowerShell",      _poster_ps1,    marker="poster_ps1.done.json"),
+    Step("update",      "git fetch/reset category repos",       _update_repos,  marker=None,              always_run=True),
+    Step("sync_images", "Sync images to repo folders",          _sync_images,   marker="sync_images.done.json"),
+    Step("readme",      "Generate README grid(s)",              None,           marker="readme.done.json"),
+    Step("sync_md",     "Mirror *.md back to config (per style)", None,         marker="sync_md.done.json"),
+    Step("push",        "Commit & push changes upstream",       _push_repos,    marker=None,              always_run=True),
+)
+
+STEP_INDEX = {s.key: i for i, s in enumerate(STEPS)}
+
+
 def main():
     import argparse
-    load_env_or_bootstrap()
 
     parser = argparse.ArgumentParser(description="Fixed-order, resumable pipeline runner")
     parser.add_argument("--from", dest="from_key", help="Start at this step key (enforced order).")
@@ -338,330 +1122,451 @@ def main():
     parser.add_argument("--styles", help="Comma list of styles for README/MD (overrides ORCH_STYLES).")
     # BG verification / early-exit controls
     parser.add_argument("--bg-output-dir", help="Where sel_remove_bg downloads go (env SEL_DOWNLOAD_DIR).")
-    parser.add_argument("--bg-exts", default=os.getenv("ORCH_BG_EXTS", "png"),
-                        help="Comma list of extensions to count as processed (default: png)")
+    parser.add_argument("--bg-exts",
+                        help="Comma list of extensions to count as processed (env ORCH_BG_EXTS, default: png)")
     parser.add_argument("--continue-if-empty", action="store_true",
                         help="Don't stop even if sel_remove_bg produced nothing (env ORCH_CONTINUE_IF_EMPTY)")
+    parser.add_argument("--sequential", action="store_true",
+                        help="Run one step at a time, in the fixed order (don't start independent steps together).")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Run every step in a fresh interpreter (no warm in-process workers).")
+    parser.add_argument("--max-concurrency", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Most steps to run at once when independent steps start together (default: min(4, CPUs)).")
+    parser.add_argument("--max-concurrency-net", type=int, default=2,
+                        help="Most network-bound steps (tmdb, remove_bg, update, push) to run at once (default: 2).")
+    parser.add_argument("--events-file",
+                        help="Append JSON-lines step start/end events to this file.")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Print each step's full command line before running it.")
+    parser.add_argument("--continue-on-failure", dest="continue_on_failure", action="store_true",
+                        help="When a step fails, keep running the steps that don't depend on it; exit 1 at the end.")
+    parser.add_argument("--fail-fast", dest="continue_on_failure", action="store_false",
+                        help="Stop at the first failing step (default).")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print the command line of every step that would run, then exit (nothing is run or written).")
 
     args = parser.parse_args()
 
-    # Resolve env/args
-    logs_dir = Path(args.logs_dir).expanduser().resolve() if args.logs_dir else env_path("ORCH_LOGS_DIR")
-    repo_root = Path(args.repo_root).expanduser().resolve() if args.repo_root else env_path("PEOPLE_IMAGES_DIR")
-    branch = args.branch or os.getenv("PEOPLE_BRANCH", "")
-    default_style = args.style or os.getenv("ORCH_STYLE", "transparent")
-    styles_env = os.getenv("ORCH_STYLES", "")
-    if args.styles:
-        styles = [s.strip() for s in args.styles.split(",") if s.strip()]
-    elif styles_env:
-        styles = [s.strip() for s in styles_env.split(",") if s.strip()]
-    else:
-        styles = [default_style]
-
-    commit_template = os.getenv("ORCH_COMMIT_MESSAGE", "")
-    git_user_name = os.getenv("ORCH_GIT_USER_NAME", "")
-    git_user_email = os.getenv("ORCH_GIT_USER_EMAIL", "")
-
-    bg_output_dir = Path(args.bg_output_dir).expanduser().resolve() if args.bg_output_dir else env_path("SEL_DOWNLOAD_DIR")
-    bg_exts = {e.strip().lower().lstrip(".") for e in (args.bg_exts or "png").split(",") if e.strip()}
-    continue_if_empty = args.continue_if_empty or _bool_env("ORCH_CONTINUE_IF_EMPTY", False)
-
-    REQUIRE_POWERSHELL = _bool_env("ORCH_REQUIRE_POWERSHELL", False)
-    REQUIRE_BG_OUTPUT = _bool_env("ORCH_REQUIRE_BG_OUTPUT", False)
-
-    # Build step builders
-    py = sys.executable
-
-    def _require_repo_or_die():
-        if not repo_root or not repo_root.exists():
-            print("[ERROR] PEOPLE_IMAGES_DIR not set or invalid; required for this step.", file=sys.stderr)
-            sys.exit(2)
-
-    def _ensure_repo():
-        # Let ensure_people_repo.py figure things out (clone/validate)
-        args2 = ["--repo-root", str(repo_root)] if repo_root else []
-        return [py, "ensure_people_repo.py"] + args2
-
-    def _name_check():
-        if not logs_dir or not logs_dir.exists():
-            print("[ERROR] ORCH_LOGS_DIR not set or missing. Use --logs-dir.", file=sys.stderr)
-            sys.exit(2)
-        return [py, "name_checker_dir.py", "--input_directory", str(logs_dir)]
-
-    def _missing():
-        if not logs_dir or not logs_dir.exists():
-            print("[ERROR] ORCH_LOGS_DIR not set or missing. Use --logs-dir.", file=sys.stderr)
-            sys.exit(2)
-        return [py, "get_missing_people.py", "--input_directory", str(logs_dir)]
-
-    def _tmdb():
-        if not os.getenv("TMDB_KEY"):
-            print("[ERROR] TMDB_KEY not set in ./config/.env; cannot run tmdb step.", file=sys.stderr)
-            sys.exit(2)
-        return [py, "tmdb_people.py"]
-
-    def _truncate():
-        return [py, "truncate_tmdb_people_names.py"]
-
-    def _missing_dir():
-        return [py, "get_missing_people_dir.py"]
-
-    def _prep_dirs():
-        return [py, "prep_people_dirs.py"]
+    global SHOW_ARGV, EVENTS_FH
+    SHOW_ARGV = args.verbose
 
-    def _remove_bg():
-        # If caller requires output verification but we cannot locate output dir — fail now.
-        if REQUIRE_BG_OUTPUT and not bg_output_dir:
-            print("[ERROR] ORCH_REQUIRE_BG_OUTPUT is true but SEL_DOWNLOAD_DIR is not set.", file=sys.stderr)
-            sys.exit(2)
-        return [py, "sel_remove_bg.py"]
-
-    def _poster_ps1():
-        ps = ps_exe()
-        if not ps:
-            if REQUIRE_POWERSHELL:
-                print("[ERROR] ORCH_REQUIRE_POWERSHELL=true but PowerShell (pwsh) not found.", file=sys.stderr)
-                sys.exit(2)
-            print("[WARN] PowerShell (pwsh) not found — skipping create_people_poster.ps1", file=sys.stderr)
-            return None
-        ps1 = str((SCRIPT_DIR / "create_people_poster.ps1").resolve())
-        return [ps, "-NoLogo", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", ps1]
-
-    def _update_repos():
-        _require_repo_or_die()
-        args2 = ["--repo-root", str(repo_root)]
-        if branch:
-            args2 += ["--branch", branch]
-        args2 += ["--op", "update", "--mode", "hardreset", "--clean-ignored"]
-        return [py, "update_people_repos.py"] + args2
-
-    def _sync_images():
-        _require_repo_or_die()
-        return [py, "sync_people_images.py", "--dest_root", str(repo_root)]
-
-    # Per-style builders (used during the run loop)
-    def _auto_readme_for(style: str):
-        _require_repo_or_die()
-        return [py, "auto_readme.py", "--style", style, "--directory", str((repo_root / style).resolve())]
-
-    def _sync_md_for(style: str):
-        _require_repo_or_die()
-        src = str((repo_root / style).resolve())
-        dst = str((CONFIG_DIR / "people_dirs" / style).resolve())
-        return [py, "sync_md.py", "--src", src, "--dst", dst, "--pattern", "*.md"]
-
-    def _push_repos():
-        _require_repo_or_die()
-        now = datetime.now().strftime("%Y-%m-%d %H:%M")
-        styles_tag = ",".join(styles)
-        msg = (commit_template or f"chore: sync posters & docs [{styles_tag}] — {now}").strip()
-        args2 = ["--repo-root", str(repo_root)]
-        if branch:
-            args2 += ["--branch", branch]
-        args2 += ["--op", "push", "--message", msg]
-        if git_user_name:
-            args2 += ["--git-user-name", git_user_name]
-        if git_user_email:
-            args2 += ["--git-user-email", git_user_email]
-        return [py, "update_people_repos.py"] + args2
-
-    # Fixed, enforced order
-    steps: List[Step] = [
-        Step("ensure_repo", "Validate People-Images repo",          _ensure_repo,   marker=None,              always_run=True),
-        Step("name_check",  "Scan Kometa logs for missing names",   _name_check,    marker="name_check.done.json"),
-        Step("missing",     "Build missing-people lists",           _missing,       marker="missing.done.json"),
-        Step("tmdb",        "Download posters via TMDB",            _tmdb,          marker="tmdb.done.json"),
-        Step("truncate",    "Truncate TMDB person names",           _truncate,      marker="truncate.done.json"),
-        Step("missing_dir", "Dir-based missing discovery",          _missing_dir,   marker="missing_dir.done.json"),
-        Step("prep_dirs",   "Ensure local people_dirs scaffolds",   _prep_dirs,     marker="prep_dirs.done.json"),
-        Step("remove_bg",   "Remove backgrounds (Selenium)",        _remove_bg,     marker="remove_bg.done.json"),
-        Step("poster_ps1",  "Generate posters via PowerShell",      _poster_ps1,    marker="poster_ps1.done.json"),
-        Step("update",      "git fetch/reset category repos",       _update_repos,  marker=None,              always_run=True),
-        Step("sync_images", "Sync images to repo folders",          _sync_images,   marker="sync_images.done.json"),
-        Step("readme",      "Generate README grid(s)",              None,           marker="readme.done.json"),
-        Step("sync_md",     "Mirror *.md back to config (per style)", None,         marker="sync_md.done.json"),
-        Step("push",        "Commit & push changes upstream",       _push_repos,    marker=None,              always_run=True),
-    ]
-
-    step_index = {s.key: i for i, s in enumerate(steps)}
-
-    # Status mode
+    # Status mode: only reads checkpoint names (no .env load, no state dir created)
     if args.list:
-        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        done = done_markers()
         print("Step status:")
-        for s in steps:
-            status = "ALWAYS" if s.always_run else ("DONE" if marker_exists(s.marker_path) else "PENDING")
+        for s in STEPS:
+            status = "ALWAYS" if s.always_run else ("DONE" if s.marker in done else "PENDING")
             print(f" - {s.key:12} : {status}")
-        for s in steps:
-            if s.always_run or not marker_exists(s.marker_path):
+        for s in STEPS:
+            if s.always_run or s.marker not in done:
                 print(f"\nNext step would be: {s.key} — {s.title}")
                 break
         return
 
+    env = load_env_or_bootstrap(dry_run=args.dry_run)
+    setup_logging()
+
+    # Resolve env/args (CLI wins; env values were read once into `env`).
+    # A dry run only prints argv, so CLI paths are taken as given (no resolve()/exists() stat calls).
+    def _cli_path(value: str) -> Path:
+        p = Path(value).expanduser()
+        return p if args.dry_run else p.resolve()
+
+    logs_dir = _cli_path(args.logs_dir) if args.logs_dir else env.logs_dir
+    if args.dry_run:
+        logs_ok = logs_dir is not None
+    else:
+        logs_ok = logs_dir.exists() if args.logs_dir else env.logs_dir_exists
+    repo_root = _cli_path(args.repo_root) if args.repo_root else env.repo_root
+    branch = args.branch or env.branch
+    default_style = args.style or env.style
+    styles_env = env.styles
+    if args.styles:
+        styles = [s.strip() for s in args.styles.split(",") if s.strip()]
+    elif styles_env:
+        styles = [s.strip() for s in styles_env.split(",") if s.strip()]
+    else:
+        styles = [default_style]
+
+    commit_template = env.commit_message
+    git_user_name = env.git_user_name
+    git_user_email = env.git_user_email
+
+    bg_output_dir = _cli_path(args.bg_output_dir) if args.bg_output_dir else env.bg_output_dir
+    bg_exts = {e.strip().lower().lstrip(".") for e in (args.bg_exts or env.bg_exts or "png").split(",") if e.strip()}
+    continue_if_empty = args.continue_if_empty or env.continue_if_empty
+
+    REQUIRE_POWERSHELL = env.require_powershell
+    REQUIRE_BG_OUTPUT = env.require_bg_output
+
+    # Path arguments are resolved once here; the builders only assemble argv from ctx.
+    ctx = RunCtx(
+        env=env,
+        logs_dir=logs_dir,
+        logs_ok=logs_ok,
+        repo_root=repo_root,
+        branch=branch,
+        styles=tuple(styles),
+        commit_template=commit_template,
+        git_user_name=git_user_name,
+        git_user_email=git_user_email,
+        bg_output_dir=bg_output_dir,
+        require_powershell=REQUIRE_POWERSHELL,
+        require_bg_output=REQUIRE_BG_OUTPUT,
+        repo_root_str=str(repo_root) if repo_root else "",
+        logs_dir_str=str(logs_dir) if logs_dir else "",
+        style_dirs={st: str(_cli_path(str(repo_root / st))) if repo_root else "" for st in styles},
+        style_config_dirs={st: str(_cli_path(str(CONFIG_DIR / "people_dirs" / st))) for st in styles},
+        dry_run=args.dry_run,
+    )
+
     # Handle --redo
     if args.redo:
-        if args.redo not in step_index:
+        if args.redo not in STEP_INDEX:
             print(f"[ERROR] Unknown step key for --redo: {args.redo}", file=sys.stderr)
-            print("Valid keys:", ", ".join(step_index.keys()), file=sys.stderr)
+            print("Valid keys:", ", ".join(STEP_INDEX.keys()), file=sys.stderr)
             sys.exit(2)
-        clear_from(list(step_index.keys()), args.redo)
+        if not args.dry_run:
+            clear_from(list(STEP_INDEX.keys()), args.redo)
 
     # Compute start index
     start_i = 0
     if args.force:
         start_i = 0
+    elif args.redo and args.dry_run:
+        start_i = STEP_INDEX[args.redo]  # checkpoints were left in place
     elif args.from_key:
-        if args.from_key not in step_index:
+        if args.from_key not in STEP_INDEX:
             print(f"[ERROR] Unknown step key for --from: {args.from_key}", file=sys.stderr)
-            print("Valid keys:", ", ".join(step_index.keys()), file=sys.stderr)
+            print("Valid keys:", ", ".join(STEP_INDEX.keys()), file=sys.stderr)
             sys.exit(2)
-        start_i = step_index[args.from_key]
+        start_i = STEP_INDEX[args.from_key]
     else:
-        for i, s in enumerate(steps):
-            if s.always_run or not marker_exists(s.marker_path):
+        done = done_markers()
+        for i, s in enumerate(STEPS):
+            if s.always_run or s.marker not in done:
                 start_i = i
                 break
 
+    # Dry run: print the planned commands (steps on one line start together) and stop here;
+    # no preflight, lock, checkpoints or logs.
+    if args.dry_run:
+        to_run = [s.key for s in STEPS[start_i:]]
+        batches = [[k] for k in to_run] if args.sequential or args.max_concurrency <= 1 else step_batches(to_run)
+        if not repo_root or not repo_root.exists():
+            print("[WARN] PEOPLE_IMAGES_DIR not set or missing; steps that need the repo would stop a real run.",
+                  file=sys.stderr)
+        print("Planned commands (dry run):")
+        for batch in batches:
+            for n, key in enumerate(batch):
+                s = STEPS[STEP_INDEX[key]]
+                lead = " - " if n == 0 else " + "
+                if key in ("readme", "sync_md"):
+                    build_for = _auto_readme_for if key == "readme" else _sync_md_for
+                    for st in styles:
+                        print(f"{lead}{key:12} : {shlex.join(build_for(ctx, st))}")
+                    continue
+                argv = s.builder(ctx)
+                print(f"{lead}{key:12} : {shlex.join(argv) if argv else '(skipped)'}")
+        return
+
+    def log_path_for(script_filename: str) -> Path:
+        return CONFIG_DIR / "logs" / f"{Path(script_filename).stem}.log"
+
+    def _build(s: Step) -> Optional[List[str]]:
+        """argv for a normal step, or None when it was skipped (and checkpointed as such)."""
+        builder = s.builder
+        if builder is None:
+            print(f"[ERROR] Step {s.key} has no builder.", file=sys.stderr)
+            sys.exit(2)
+        argv = builder(ctx)
+        if argv is None:
+            # Only allowed skip is poster_ps1 when pwsh missing & not required
+            if s.key == "poster_ps1":
+                _checkpoint(s, skipped=True)
+                return None
+            # Any other None means something critical was missing; die
+            print(f"[ERROR] Step {s.key} could not build its command.", file=sys.stderr)
+            sys.exit(2)
+        return argv
+
+    # Keys _post_step acts on (a step in this set can't be exec'd as the final step)
+    POST_CHECKED_STEPS = {"ensure_repo", "name_check", "missing", "tmdb", "missing_dir",
+                          "prep_dirs", "remove_bg", "sync_images"}
+
+    results: dict[str, int] = {}  # step key -> exit code, for steps that ran
+    skipped: List[str] = []       # steps not run because a step they depend on failed or was skipped
+    step_info: dict[str, dict] = {}  # extra per-step details for the manifest
+    step_started_at: dict[str, float] = {}
+    run_started = time.time()
+
+    def _checkpoint(s: Step, **meta) -> None:
+        """Mark a step done: details go to the manifest, the checkpoint itself is an empty file."""
+        step_info.setdefault(s.key, {}).update(meta, at=time.time())
+        if s.marker_path and not s.always_run:
+            s.marker_path.touch()
+
+    def _write_manifest() -> None:
+        """One JSON with every step of this run (rc, start, details), so tools needn't read each checkpoint."""
+        steps_out = {}
+        for key in sorted(set(results) | set(step_info) | set(skipped), key=STEP_INDEX.get):
+            info: dict = {"rc": results.get(key), "started": step_started_at.get(key)}
+            if key in skipped:
+                info["skipped"] = True
+            info.update(step_info.get(key, {}))
+            steps_out[key] = info
+        try:
+            write_marker(MANIFEST, {"started": run_started, "finished": time.time(), "steps": steps_out},
+                         atomic=True)
+        except OSError as e:
+            print(f"[WARN] Could not write {MANIFEST}: {e}", file=sys.stderr)
+
+    def _stop_early(msg: str) -> None:
+        """A step confidently produced nothing: stop here (exit 0, or 1 if --continue-on-failure saw failures)."""
+        print(msg)
+        if any(results.values()):
+            print(f"[FAIL] Stopped early after failures in: {', '.join(k for k, rc in results.items() if rc)}.",
+                  file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+
+    def _post_step(s: Step, started: float) -> None:
+        """Post-step fail-fast checks (confident zeros -> exit 0; hard requirements -> exit 2)."""
+        # 1) ensure_repo extra sanity
+        if s.key == "ensure_repo":
+            if not repo_root or not repo_root.exists():
+                print("[ERROR] ensure_repo finished but PEOPLE_IMAGES_DIR is not set/valid.", file=sys.stderr)
+                sys.exit(2)
+            # require at least one expected category dir present
+            present = [d for d in CATEGORY_DIRS if (repo_root / d).exists()]
+            if not present:
+                print("[ERROR] ensure_repo did not yield expected category folders under repo root.", file=sys.stderr)
+                sys.exit(2)
+
+        # name_check: if clearly zero, stop
+        elif s.key == "name_check":
+            zero = parse_zero_from_log(log_path_for("name_checker_dir.py"), started)
+            if zero is True:
+                _stop_early("[INFO] name_check found 0 items — stopping.")
+
+        # missing: if clearly zero, stop
+        elif s.key == "missing":
+            zero = parse_zero_from_log(log_path_for("get_missing_people.py"), started)
+            if zero is True:
+                _stop_early("[INFO] missing produced 0 items — stopping.")
+
+        # tmdb: if no new posters created, stop
+        elif s.key == "tmdb":
+            created = count_recent_files([CONFIG_DIR], started, {"jpg", "jpeg", "png"}, limit=1)
+            if created == 0:
+                _stop_early("[INFO] tmdb downloaded 0 posters — stopping.")
+
+        # missing_dir: if processed 0, stop (parse its log rather than filesystem)
+        elif s.key == "missing_dir":
+            md_count = parsed_processed_from_missing_dir(log_path_for("get_missing_people_dir.py"), started)
+            if md_count is not None and md_count == 0:
+                _stop_early("[INFO] missing_dir sorted/moved 0 items — stopping.")
+
+        # prep_dirs: if established/moved 0 artifacts, stop (use fs heuristic as fallback)
+        elif s.key == "prep_dirs":
+            pd = CONFIG_DIR / "people_dirs"
+            changed = count_recent_files([pd], started, {"jpg", "jpeg", "png", "md"}, limit=1)
+            if changed == 0:
+                zero = parse_zero_from_log(log_path_for("prep_people_dirs.py"), started)
+                if zero is True:
+                    _stop_early("[INFO] prep_dirs moved 0 items — stopping.")
+
+        # remove_bg: verify outputs and possibly stop
+        elif s.key == "remove_bg":
+            if REQUIRE_BG_OUTPUT and not bg_output_dir:
+                print("[ERROR] ORCH_REQUIRE_BG_OUTPUT=true but SEL_DOWNLOAD_DIR is unknown.", file=sys.stderr)
+                sys.exit(2)
+            processed = count_recent_files([bg_output_dir] if bg_output_dir else [], started, bg_exts, limit=1)
+            if processed == 0 and not continue_if_empty:
+                # If fs says 0, but the tool log shows >0, continue (saves you from dir mismatch).
+                rb_log = log_path_for("sel_remove_bg.py")
+                log_n = parsed_files_processed_from_remove_bg(rb_log, started)
+                if (log_n is None) or (log_n == 0):
+                    _stop_early(f"[INFO] sel_remove_bg produced 0 files in {bg_output_dir} — stopping.")
+
+        # sync_images: if copied nothing, stop before readme/sync_md/push (parse its log)
+        elif s.key == "sync_images":
+            sync_log = log_path_for("sync_people_images.py")
+            copied_sum = sum_copied_from_sync_log(sync_log, started)
+            if copied_sum is not None and copied_sum == 0:
+                _stop_early("[INFO] sync_images copied 0 files — stopping before readme/sync_md/push.")
+
+    def _preflight(keys: List[str]) -> List[str]:
+        """Everything that would stop a later step, collected before the first one runs."""
+        problems: List[str] = []
+        keyset = set(keys)
+        if keyset & {"name_check", "missing"}:
+            if not logs_ok:
+                problems.append("ORCH_LOGS_DIR not set or missing (name_check/missing). Use --logs-dir.")
+            elif not os.access(logs_dir, os.R_OK | os.X_OK):
+                problems.append(f"Kometa logs folder is not readable: {logs_dir}")
+        if "tmdb" in keyset and not env.tmdb_key_set:
+            problems.append("TMDB_KEY not set in ./config/.env (tmdb).")
+        if "remove_bg" in keyset and REQUIRE_BG_OUTPUT and not bg_output_dir:
+            problems.append("ORCH_REQUIRE_BG_OUTPUT is true but SEL_DOWNLOAD_DIR is not set (remove_bg).")
+        if "poster_ps1" in keyset and REQUIRE_POWERSHELL and not ps_exe():
+            problems.append("ORCH_REQUIRE_POWERSHELL=true but PowerShell (pwsh) not found (poster_ps1).")
+        repo_steps = sorted(keyset & {"update", "sync_images", "readme", "sync_md", "push"}, key=STEP_INDEX.get)
+        if repo_steps:
+            needed_by = ", ".join(repo_steps)
+            if not repo_root:
+                problems.append(f"PEOPLE_IMAGES_DIR not set; required by {needed_by}. Use --repo-root.")
+            elif repo_root.exists():
+                if not os.access(repo_root, os.R_OK | os.W_OK | os.X_OK):
+                    problems.append(f"Repo root is not readable/writable: {repo_root}")
+            elif "ensure_repo" not in keyset:  # otherwise ensure_repo may still create it
+                problems.append(f"Repo root does not exist: {repo_root} (required by {needed_by}).")
+        return problems
+
+    def _run_one(key: str, title: str, argv: List[str], capture: bool = False, **extra):
+        emit_event(key, "start", **extra)
+        result = run_cmd(title, argv, capture=capture)
+        emit_event(key, "end", rc=result[0], **extra)
+        return result
+
+    # Preflight: fail now rather than after the long steps that come first
+    problems = _preflight([s.key for s in STEPS[start_i:]])
+    if problems:
+        print("[ERROR] Preflight failed:", file=sys.stderr)
+        for msg in problems:
+            print(f"  - {msg}", file=sys.stderr)
+        sys.exit(2)
+
     # Run
     acquire_lock()
-    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    if args.events_file:
+        EVENTS_FH = open(args.events_file, "a", encoding="utf-8")
     try:
-        step_started_at: dict[str, float] = {}
-        for s in steps[start_i:]:
-            step_started_at[s.key] = time.time()
-
-            # Special multi-style steps handle inside the loop
-            if s.key == "readme":
-                # generate README for each style
-                for st in styles:
-                    argv = _auto_readme_for(st)
-                    rc, _, _ = run_cmd(f"Generate README grid [{st}]", argv)
+        def _blocked_by(key: str) -> List[str]:
+            return sorted(d for d in DEPENDENCIES.get(key, set()) if results.get(d, 0) != 0 or d in skipped)
+
+        def _skip(key: str, blockers: List[str]) -> None:
+            skipped.append(key)
+            print(f"[SKIP] {key}: depends on {', '.join(blockers)}, which did not complete.", file=sys.stderr)
+            emit_event(key, "skipped", blocked_by=blockers)
+
+        to_run = [s.key for s in STEPS[start_i:]]
+        one_at_a_time = args.sequential or args.max_concurrency <= 1
+        batches = [[k] for k in to_run] if one_at_a_time else step_batches(to_run)
+        if not args.isolate:
+            widest = max(len(b) for b in batches) if batches else 1
+            if {"readme", "sync_md"} & set(to_run):
+                widest = max(widest, len(styles))  # their styles run side by side
+            start_step_pool(min(widest, max(1, args.max_concurrency)))
+        for batch in batches:
+            # Special multi-style steps handle inside the loop (never batched: readme/sync_md depend on their predecessors)
+            if batch == ["readme"] or batch == ["sync_md"]:
+                key = batch[0]
+                blockers = _blocked_by(key)
+                if blockers:
+                    _skip(key, blockers)
+                    continue
+                step_started_at[key] = time.time()
+                s = STEPS[STEP_INDEX[key]]
+                # readme: generate README for each style; sync_md: sync md for each style.
+                # Styles are separate folders, so they run side by side unless one at a time was asked for.
+                build_for = _auto_readme_for if key == "readme" else _sync_md_for
+                what = "Generate README grid" if key == "readme" else "Mirror *.md back to config"
+                style_runs = [(st, build_for(ctx, st)) for st in styles]
+                if len(style_runs) > 1 and not one_at_a_time:
+                    style_rcs = [r[0] for r in asyncio.run(run_batch_async(
+                        [(key, f"{what} [{st}]", argv, False, {"style": st}) for st, argv in style_runs],
+                        args.max_concurrency, args.max_concurrency_net))]
+                else:
+                    style_rcs = []
+                    for st, argv in style_runs:
+                        style_rcs.append(_run_one(key, f"{what} [{st}]", argv, style=st)[0])
+                        if style_rcs[-1] != 0:
+                            break
+                rc = 0
+                for (st, _), rc in zip(style_runs, style_rcs):
                     if rc != 0:
-                        print(f"[FAIL] readme ({st}) exited with code {rc}. Stopping.", file=sys.stderr)
-                        sys.exit(rc)
+                        if not args.continue_on_failure:
+                            print(f"[FAIL] {key} ({st}) exited with code {rc}. Stopping.", file=sys.stderr)
+                            sys.exit(rc)
+                        print(f"[FAIL] {key} ({st}) exited with code {rc}; continuing with independent steps.",
+                              file=sys.stderr)
+                        break
+                results[key] = rc
                 # checkpoint once for the whole batch
-                if s.marker_path:
-                    write_marker(s.marker_path, {"at": time.time(), "styles": styles})
+                if rc == 0:
+                    _checkpoint(s, styles=styles)
                 continue
 
-            if s.key == "sync_md":
-                # sync md for each style
-                for st in styles:
-                    argv = _sync_md_for(st)
-                    rc, _, _ = run_cmd(f"Mirror *.md back to config [{st}]", argv)
-                    if rc != 0:
-                        print(f"[FAIL] sync_md ({st}) exited with code {rc}. Stopping.", file=sys.stderr)
+            # Normal steps: build every command first (builders may fail fast), then launch
+            runs: List[Tuple[Step, List[str]]] = []
+            for key in batch:
+                blockers = _blocked_by(key)
+                if blockers:
+                    _skip(key, blockers)
+                    continue
+                s = STEPS[STEP_INDEX[key]]
+                step_started_at[key] = time.time()
+                argv = _build(s)
+                if argv is not None:
+                    runs.append((s, argv))
+
+            # Final step with nothing left to do afterwards (no checkpoint, no post-step check; in practice
+            # push): on POSIX exec it in place so it takes over this process instead of being waited on.
+            if (batch is batches[-1] and len(runs) == 1 and os.name == "posix" and EVENTS_FH is None
+                    and not skipped and not any(results.values())  # its exit code must be the run's
+                    and runs[0][0].marker_path is None and runs[0][0].key not in POST_CHECKED_STEPS):
+                s, argv = runs[0]
+                print_banner(s.title, argv)
+                step_info[s.key] = {"argv": argv, "exec": True}  # its exit code is the process's
+                _write_manifest()
+                stop_step_pool()
+                keep_lock_across_exec()
+                sys.stdout.flush()
+                sys.stderr.flush()
+                try:
+                    os.chdir(SCRIPT_DIR)
+                    os.execvp(argv[0], argv)
+                except OSError as e:
+                    print(f"[WARN] exec of final step failed ({e}); running it as a child instead.", file=sys.stderr)
+                    step_info.pop(s.key, None)
+                    keep_lock_across_exec(False)
+
+            if len(runs) > 1:
+                # Started together: output streams live, each line prefixed with its step title
+                batch_results = asyncio.run(run_batch_async(
+                    [(s.key, s.title, argv, s.key in CAPTURED_STEPS) for s, argv in runs],
+                    args.max_concurrency, args.max_concurrency_net))
+            else:
+                batch_results = [_run_one(s.key, s.title, argv, capture=(s.key in CAPTURED_STEPS)) for s, argv in runs]
+
+            # Results, fail-fast checks and checkpoints are handled in the fixed order
+            for (s, argv), (rc, _, _) in zip(runs, batch_results):
+                results[s.key] = rc
+                if rc != 0:
+                    if not args.continue_on_failure:
+                        print(f"[FAIL] {s.key} exited with code {rc}. Stopping.", file=sys.stderr)
                         sys.exit(rc)
-                if s.marker_path:
-                    write_marker(s.marker_path, {"at": time.time(), "styles": styles})
-                continue
-
-            # Normal steps
-            builder = s.builder
-            if builder is None:
-                print(f"[ERROR] Step {s.key} has no builder.", file=sys.stderr)
-                sys.exit(2)
-            argv = builder()
-            if argv is None:
-                # Only allowed skip is poster_ps1 when pwsh missing & not required
-                if s.key == "poster_ps1":
-                    if s.marker_path:
-                        write_marker(s.marker_path, {"skipped": True, "at": time.time()})
+                    print(f"[FAIL] {s.key} exited with code {rc}; continuing with independent steps.",
+                          file=sys.stderr)
                     continue
-                # Any other None means something critical was missing; die
-                print(f"[ERROR] Step {s.key} could not build its command.", file=sys.stderr)
-                sys.exit(2)
 
-            # ensure_repo must exist AND return success; also sanity-check the repo root afterward
-            capture_output = (s.key in {"name_check", "missing"})
-            rc, out, _ = run_cmd(s.title, argv, capture=capture_output)
-            if rc != 0:
-                print(f"[FAIL] {s.key} exited with code {rc}. Stopping.", file=sys.stderr)
-                sys.exit(rc)
-
-            # Post-step fail-fast checks (confident zeros -> exit 0; hard requirements -> exit 2)
-            started = step_started_at[s.key]
-
-            def log_path_for(script_filename: str) -> Path:
-                return CONFIG_DIR / "logs" / f"{Path(script_filename).stem}.log"
-
-            # 1) ensure_repo extra sanity
-            if s.key == "ensure_repo":
-                if not repo_root or not repo_root.exists():
-                    print("[ERROR] ensure_repo finished but PEOPLE_IMAGES_DIR is not set/valid.", file=sys.stderr)
-                    sys.exit(2)
-                # require at least one expected category dir present
-                present = [d for d in CATEGORY_DIRS if (repo_root / d).exists()]
-                if not present:
-                    print("[ERROR] ensure_repo did not yield expected category folders under repo root.", file=sys.stderr)
-                    sys.exit(2)
-
-            # name_check: if clearly zero, stop
-            elif s.key == "name_check":
-                zero = parse_zero_from_log(log_path_for("name_checker_dir.py"))
-                if zero is True:
-                    print("[INFO] name_check found 0 items — stopping.")
-                    sys.exit(0)
+                _post_step(s, step_started_at[s.key])
 
-            # missing: if clearly zero, stop
-            elif s.key == "missing":
-                zero = parse_zero_from_log(log_path_for("get_missing_people.py"))
-                if zero is True:
-                    print("[INFO] missing produced 0 items — stopping.")
-                    sys.exit(0)
-
-            # tmdb: if no new posters created, stop
-            elif s.key == "tmdb":
-                created = count_recent_files([CONFIG_DIR], started, {"jpg", "jpeg", "png"})
-                if created == 0:
-                    print("[INFO] tmdb downloaded 0 posters — stopping.")
-                    sys.exit(0)
-
-            # missing_dir: if processed 0, stop (parse its log rather than filesystem)
-            elif s.key == "missing_dir":
-                md_count = parsed_processed_from_missing_dir(log_path_for("get_missing_people_dir.py"))
-                if md_count is not None and md_count == 0:
-                    print("[INFO] missing_dir sorted/moved 0 items — stopping.")
-                    sys.exit(0)
-
-            # prep_dirs: if established/moved 0 artifacts, stop (use fs heuristic as fallback)
-            elif s.key == "prep_dirs":
-                pd = CONFIG_DIR / "people_dirs"
-                changed = count_recent_files([pd], started, {"jpg", "jpeg", "png", "md"})
-                if changed == 0:
-                    zero = parse_zero_from_log(log_path_for("prep_people_dirs.py"))
-                    if zero is True:
-                        print("[INFO] prep_dirs moved 0 items — stopping.")
-                        sys.exit(0)
-
-            # remove_bg: verify outputs and possibly stop
-            elif s.key == "remove_bg":
-                if REQUIRE_BG_OUTPUT and not bg_output_dir:
-                    print("[ERROR] ORCH_REQUIRE_BG_OUTPUT=true but SEL_DOWNLOAD_DIR is unknown.", file=sys.stderr)
-                    sys.exit(2)
-                processed = count_recent_files([bg_output_dir] if bg_output_dir else [], started, bg_exts)
-                if processed == 0 and not continue_if_empty:
-                    # If fs says 0, but the tool log shows >0, continue (saves you from dir mismatch).
-                    rb_log = log_path_for("sel_remove_bg.py")
-                    log_n = parsed_files_processed_from_remove_bg(rb_log)
-                    if (log_n is None) or (log_n == 0):
-                        print(f"[INFO] sel_remove_bg produced 0 files in {bg_output_dir} — stopping.")
-                        sys.exit(0)
-
-            # sync_images: if copied nothing, stop before readme/sync_md/push (parse its log)
-            elif s.key == "sync_images":
-                sync_log = log_path_for("sync_people_images.py")
-                copied_sum = sum_copied_from_sync_log(sync_log)
-                if copied_sum is not None and copied_sum == 0:
-                    print("[INFO] sync_images copied 0 files — stopping before readme/sync_md/push.")
-                    sys.exit(0)
-
-            # Write checkpoint if applicable (and not always_run)
-            if s.marker_path and not s.always_run:
-                write_marker(s.marker_path, {"at": time.time(), "argv": argv})
+                # Write checkpoint if applicable (and not always_run)
+                _checkpoint(s, argv=argv)
 
+        failed = [k for k, rc in results.items() if rc != 0]
+        if failed or skipped:
+            print(f"\n[FAIL] Failed: {', '.join(failed) or '-'}; skipped: {', '.join(skipped) or '-'}.", file=sys.stderr)
+            sys.exit(1)
         print("\nAll steps completed.")
     finally:
+        stop_step_pool()
+        _write_manifest()
+        if EVENTS_FH is not None:
+            EVENTS_FH.close()
+            EVENTS_FH = None
         release_lock()
 
 
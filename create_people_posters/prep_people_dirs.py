@@ -1,5 +1,7 @@
 import os
 import sys
+import errno
+import shutil
 import logging
 from pathlib import Path
 from timeit import default_timer as timer
@@ -39,10 +41,17 @@ load_dotenv(CONFIG_DIR / ".env")
 
 
 # ---------- helpers ----------
-def list_files(dir_path: Path):
-    if not dir_path.exists():
+# progress bar: advance in batches of BAR_EVERY files; the per-file line is only built for a terminal
+BAR_EVERY = 64
+
+
+def list_files(dir_path: Path) -> list:
+    """Files directly in dir_path as os.DirEntry (type known from the listing; no stat per entry)."""
+    try:
+        with os.scandir(dir_path) as it:
+            return [e for e in it if e.is_file()]
+    except FileNotFoundError:
         return []
-    return [p for p in dir_path.iterdir() if p.is_file()]
 
 
 def delete_files_in(dir_path: Path, title: str) -> int:
@@ -52,15 +61,21 @@ def delete_files_in(dir_path: Path, title: str) -> int:
         logging.info("%s: nothing to delete in %s", title, dir_path)
         return 0
     logging.info("%s: deleting %d file(s) in %s", title, total, dir_path)
+    show_text = sys.stdout.isatty()
     with alive_bar(total, dual_line=True, title=title) as bar:
-        for f in files:
+        for i, e in enumerate(files, 1):
             try:
-                f.unlink()
-                bar.text = f"-> deleted: {f.name}"
-            except Exception as e:
-                logging.warning("Failed to delete %s: %s", f, e)
-                bar.text = f"-> failed:  {f.name}"
-            bar()
+                os.unlink(e.path)
+                if show_text:
+                    bar.text = f"-> deleted: {e.name}"
+            except Exception as ex:
+                logging.warning("Failed to delete %s: %s", e.path, ex)
+                if show_text:
+                    bar.text = f"-> failed:  {e.name}"
+            if i % BAR_EVERY == 0:
+                bar(BAR_EVERY)
+        if total % BAR_EVERY:
+            bar(total % BAR_EVERY)
     return total
 
 
@@ -72,21 +87,27 @@ def move_all_files(src: Path, dst: Path, title: str) -> int:
         return 0
     dst.mkdir(parents=True, exist_ok=True)
     logging.info("%s: moving %d file(s) %s -> %s", title, total, src, dst)
+    show_text = sys.stdout.isatty()
     with alive_bar(total, dual_line=True, title=title) as bar:
-        for f in files:
-            target = dst / f.name
+        for i, e in enumerate(files, 1):
+            target = os.path.join(dst, e.name)
             try:
-                if target.exists():
-                    try:
-                        target.unlink()
-                    except Exception as e:
-                        logging.warning("Could not remove existing %s: %s", target, e)
-                f.replace(target)  # atomic move when possible
-                bar.text = f"-> moved:   {f.name}"
-            except Exception as e:
-                logging.warning("Failed to move %s -> %s: %s", f, target, e)
-                bar.text = f"-> failed:  {f.name}"
-            bar()
+                try:
+                    os.replace(e.path, target)  # atomic move; overwrites an existing target on every OS
+                except OSError as ex:
+                    if ex.errno != errno.EXDEV:
+                        raise
+                    shutil.move(e.path, target)  # different filesystem: copy + delete
+                if show_text:
+                    bar.text = f"-> moved:   {e.name}"
+            except Exception as ex:
+                logging.warning("Failed to move %s -> %s: %s", e.path, target, ex)
+                if show_text:
+                    bar.text = f"-> failed:  {e.name}"
+            if i % BAR_EVERY == 0:
+                bar(BAR_EVERY)
+        if total % BAR_EVERY:
+            bar(total % BAR_EVERY)
     return total
 
 
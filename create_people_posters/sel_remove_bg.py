@@ -155,7 +155,8 @@ def build_driver():
         "safebrowsing.enabled": True,
         "profile.default_content_setting_values.automatic_downloads": 1,
     })
-    service = Service(log_output=subprocess.DEVNULL)
+    # CHROMEDRIVER_BIN (exported by orchestrator.py) skips the driver lookup; None lets Selenium find one
+    service = Service(executable_path=os.getenv("CHROMEDRIVER_BIN") or None, log_output=subprocess.DEVNULL)
     driver = webdriver.Chrome(options=opts, service=service)
     try:
         driver.maximize_window()
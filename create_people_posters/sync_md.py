@@ -16,8 +16,10 @@ import os
 import sys
 import argparse
 import fnmatch
+import re
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from timeit import default_timer as timer
 
@@ -64,22 +66,107 @@ def load_env_if_present(override: bool = False):
         load_dotenv(env_path, override=override)
 
 
-def newer_than(src: Path, dst: Path) -> bool:
-    """Return True if src is strictly newer than dst (XO semantics)."""
+def newer_than(src_mtime: float, dst: Path) -> bool:
+    """Return True if src (given by its mtime) is strictly newer than dst (XO semantics)."""
     try:
-        return src.stat().st_mtime > dst.stat().st_mtime
+        return src_mtime > dst.stat().st_mtime
     except FileNotFoundError:
         return True  # no destination -> copy
 
 
-def find_matching_files(root: Path, pattern: str) -> list[Path]:
+def _copy_file_range(src: Path, dst: Path) -> None:
+    """Copy in-kernel with os.copy_file_range (no userland buffer; shares extents on btrfs/XFS)."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if n == 0:
+                # source shrank or the filesystem stopped short: don't leave a truncated dst marked as
+                # copied (copystat would give it src's mtime and /XO would skip it from then on)
+                raise OSError(f"copy_file_range stopped with {remaining} byte(s) left")
+            remaining -= n
+
+
+def copy2_fast(src: Path, dst: Path) -> None:
+    """
+    shutil.copy2 with an in-kernel data copy: os.copy_file_range where the OS has it, else
+    shutil.copyfile (sendfile on Linux, fcopyfile on macOS); then copystat for the timestamps (COPY:DAT).
+    """
+    try:
+        if not hasattr(os, "copy_file_range"):
+            raise OSError("copy_file_range unavailable")
+        _copy_file_range(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)  # across devices / unsupported filesystem
+    shutil.copystat(src, dst)
+
+
+def place_file(src: Path, dst: Path, link_mode: str = "copy") -> None:
+    """
+    Put src at dst, per link_mode:
+      copy     - copy2_fast (in-kernel copy; a reflink on filesystems that share extents)
+      hardlink - os.link under a temp name, then os.replace over dst; no bytes copied, but src and
+                 dst are one file afterwards, so editing either edits both
+    hardlink falls back to copy across devices or where links aren't allowed.
+    """
+    if link_mode == "hardlink":
+        tmp = dst.with_name(dst.name + ".synctmp")
+        try:
+            tmp.unlink(missing_ok=True)  # left over from an interrupted run
+            os.link(src, tmp)
+            os.replace(tmp, dst)
+            return
+        except OSError:
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+    copy2_fast(src, dst)
+
+
+def find_matching_files(root: Path, pattern: str) -> list[tuple[Path, float]]:
+    """
+    (file, st_mtime) for every file under root whose name matches pattern, via os.scandir.
+    Names are matched before anything is stat'ed, and only matches are; the mtime is kept so
+    newer_than() doesn't stat the source again.
+    """
+    if re.fullmatch(r"\*\.[A-Za-z0-9]+", pattern):
+        # plain "*.ext" (the default "*.md"): a suffix test, case-folded like fnmatch on this OS
+        suffix = os.path.normcase(pattern[1:])
+        matches = lambda name: os.path.normcase(name).endswith(suffix)
+    else:
+        matches = lambda name: fnmatch.fnmatch(name, pattern)
     files = []
-    for p in root.rglob("*"):
-        if p.is_file() and fnmatch.fnmatch(p.name, pattern):
-            files.append(p)
+    stack = [root]
+    while stack:
+        cur = stack.pop()
+        try:
+            with os.scandir(cur) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():  # same as rglob: don't descend into links
+                                stack.append(entry.path)
+                        elif matches(entry.name) and entry.is_file():
+                            files.append((Path(entry.path), entry.stat().st_mtime))
+                    except OSError as e:
+                        logging.warning("Cannot stat %s: %s", entry.path, e)
+        except OSError as e:
+            logging.warning("Cannot list %s: %s", cur, e)
+    # folder by folder, by name within each: copies read neighbouring inodes/blocks back to back
+    files.sort(key=lambda fm: (str(fm[0].parent), fm[0].name))
     return files
 
 
+# progress bar: advance in batches of BAR_EVERY files (one redraw per batch on big trees)
+BAR_EVERY = 64
+STATUS_TEXT = {
+    "copied": "-> copied:  {}",
+    "skipped": "-> skipped: {} (dest newer/same)",
+    "failed": "-> failed:  {}",
+}
+
+
 def copystat_dir(src: Path, dst: Path):
     """Preserve directory timestamps (/DCOPY:T-like)."""
     try:
@@ -88,7 +175,8 @@ def copystat_dir(src: Path, dst: Path):
         logging.debug("copystat failed on dir %s -> %s: %s", src, dst, e)
 
 
-def mirror_md(src_root: Path, dst_root: Path, pattern: str, dry_run: bool):
+def mirror_md(src_root: Path, dst_root: Path, pattern: str, dry_run: bool, workers: int = 1,
+              link_mode: str = "copy"):
     """
     Rough equivalent of:
       robocopy <src> <dst> /E /COPY:DAT /DCOPY:T /XO    (for files matching pattern only)
@@ -107,25 +195,47 @@ def mirror_md(src_root: Path, dst_root: Path, pattern: str, dry_run: bool):
 
     logging.info("Evaluating %d file(s) matching %r", total, pattern)
 
+    if not dry_run:
+        # create each destination folder once up front, not once per file (a file either already has
+        # its folder at dst or is about to be copied into it)
+        for parent in {(dst_root / f.relative_to(src_root)).parent for f, _ in files}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+    def copy_one(f: Path, mtime: float):
+        rel = f.relative_to(src_root)
+        df = dst_root / rel
+        try:
+            if newer_than(mtime, df):
+                if not dry_run:
+                    place_file(f, df, link_mode)
+                return "copied", rel
+            return "skipped", rel
+        except Exception as e:
+            logging.warning("Failed to copy %s -> %s: %s", f, df, e)
+            return "failed", rel
+
+    # the bar ticks every BAR_EVERY files, and the per-file line is only built for a terminal
+    show_text = sys.stdout.isatty()
+    pending = 0
     with alive_bar(total, dual_line=True, title=f"sync md ({pattern})") as bar:
-        for f in files:
-            rel = f.relative_to(src_root)
-            df = dst_root / rel
-            try:
-                if newer_than(f, df):
-                    bar.text = f"-> copied:  {rel}"
-                    if not dry_run:
-                        df.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(f, df)
+        # copies are I/O-bound: several in flight keep the disk/network queue busy
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for fut in as_completed([pool.submit(copy_one, f, mtime) for f, mtime in files]):
+                status, rel = fut.result()
+                if status == "copied":
                     copied += 1
-                else:
-                    bar.text = f"-> skipped: {rel} (dest newer/same)"
+                elif status == "skipped":
                     skipped += 1
-            except Exception as e:
-                failed += 1
-                bar.text = f"-> failed:  {rel}"
-                logging.warning("Failed to copy %s -> %s: %s", f, df, e)
-            bar()
+                else:
+                    failed += 1
+                if show_text:
+                    bar.text = STATUS_TEXT[status].format(rel)
+                pending += 1
+                if pending == BAR_EVERY:
+                    bar(pending)
+                    pending = 0
+            if pending:
+                bar(pending)
 
     logging.info("Summary: copied=%d, skipped=%d, failed=%d", copied, skipped, failed)
     print(f"copied={copied} skipped={skipped} failed={failed}")
@@ -141,6 +251,11 @@ def main():
     ap.add_argument("--dst", required=True, help="Destination folder")
     ap.add_argument("--pattern", default="*.md", help="Glob pattern (default: *.md)")
     ap.add_argument("--dry-run", action="store_true", help="Show what would change")
+    ap.add_argument("--workers", type=int, default=int(os.getenv("SYNC_WORKERS", "8")),
+                    help="File copies in flight at once (default: SYNC_WORKERS env or 8)")
+    ap.add_argument("--link-mode", choices=("copy", "hardlink"), default=os.getenv("SYNC_LINK_MODE", "copy"),
+                    help="copy (default) or hardlink: link instead of copying on the same filesystem; "
+                         "both paths are then the same file (default: SYNC_LINK_MODE env or copy)")
     ap.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
     args = ap.parse_args()
 
@@ -157,7 +272,7 @@ def main():
         logging.info("DRY RUN: no files will be copied.")
 
     start = timer()
-    rc = mirror_md(src, dst, args.pattern, args.dry_run)
+    rc = mirror_md(src, dst, args.pattern, args.dry_run, workers=args.workers, link_mode=args.link_mode)
     elapsed = timer() - start
     logging.info("Done in %.2fs (exit=%s)", elapsed, rc)
     return rc
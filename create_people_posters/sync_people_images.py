@@ -5,6 +5,8 @@ Sync people poster folders to a destination root (robocopy /E /COPY:DAT /DCOPY:T
 Examples:
   python sync_people_images.py --dest_root "D:/bullmoose20/Kometa-People-Images"
   PEOPLE_IMAGES_DIR="D:/bullmoose20/Kometa-People-Images" python sync_people_images.py
+  python sync_people_images.py --dest_root ... --jobs 4   # categories in parallel (no progress bars)
+  python sync_people_images.py --dest_root ... --workers 1  # one file copy at a time
 """
 
 import os
@@ -12,6 +14,7 @@ import sys
 import argparse
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from timeit import default_timer as timer
 
@@ -57,30 +60,104 @@ CATEGORIES = [
 ]
 
 
-def newer_than(src: Path, dst: Path) -> bool:
+def newer_than(src_mtime: float, dst: Path) -> bool:
     """Return True if src is strictly newer than dst (XO semantics: copy only if src > dst)."""
     try:
-        return src.stat().st_mtime > dst.stat().st_mtime
+        return src_mtime > dst.stat().st_mtime
     except FileNotFoundError:
         return True  # no destination -> copy
 
 
-def iter_dirs(src_root: Path):
-    """Yield all directories (including empty) depth-first, ensuring parents first."""
-    if not src_root.exists():
-        return
-    # parents first: sort by parts length then lexicographically
-    dirs = [p for p in src_root.rglob("*") if p.is_dir()]
-    dirs.sort(key=lambda p: (len(p.parts), str(p).lower()))
-    yield src_root
-    for d in dirs:
-        yield d
+def _copy_file_range(src: Path, dst: Path) -> None:
+    """Copy in-kernel with os.copy_file_range (no userland buffer; shares extents on btrfs/XFS)."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if n == 0:
+                # source shrank or the filesystem stopped short: don't leave a truncated dst marked as
+                # copied (copystat would give it src's mtime and /XO would skip it from then on)
+                raise OSError(f"copy_file_range stopped with {remaining} byte(s) left")
+            remaining -= n
+
+
+def copy2_fast(src: Path, dst: Path) -> None:
+    """
+    shutil.copy2 with an in-kernel data copy: os.copy_file_range where the OS has it, else
+    shutil.copyfile (sendfile on Linux, fcopyfile on macOS); then copystat for the timestamps (COPY:DAT).
+    """
+    try:
+        if not hasattr(os, "copy_file_range"):
+            raise OSError("copy_file_range unavailable")
+        _copy_file_range(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)  # across devices / unsupported filesystem
+    shutil.copystat(src, dst)
 
 
-def iter_files(src_root: Path):
+def place_file(src: Path, dst: Path, link_mode: str = "copy") -> None:
+    """
+    Put src at dst, per link_mode:
+      copy     - copy2_fast (in-kernel copy; a reflink on filesystems that share extents)
+      hardlink - os.link under a temp name, then os.replace over dst; no bytes copied, but src and
+                 dst are one file afterwards, so editing either edits both
+    hardlink falls back to copy across devices or where links aren't allowed.
+    """
+    if link_mode == "hardlink":
+        tmp = dst.with_name(dst.name + ".synctmp")
+        try:
+            tmp.unlink(missing_ok=True)  # left over from an interrupted run
+            os.link(src, tmp)
+            os.replace(tmp, dst)
+            return
+        except OSError:
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+    copy2_fast(src, dst)
+
+
+def walk_tree(src_root: Path):
+    """
+    One os.scandir pass over src_root: (dirs with parents first, [(file, st_mtime)]).
+    DirEntry carries the type from the listing, so directories and files come out of the same walk
+    with no is_dir()/is_file() stat per entry. Symlinked directories are listed but not descended into
+    (same as rglob).
+    """
     if not src_root.exists():
-        return []
-    return [p for p in src_root.rglob("*") if p.is_file()]
+        return [], []
+    dirs, files = [src_root], []
+    stack = [src_root]
+    while stack:
+        cur = stack.pop()
+        try:
+            with os.scandir(cur) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            d = Path(entry.path)
+                            dirs.append(d)  # appended before its own children are listed
+                            if not entry.is_symlink():
+                                stack.append(d)
+                        elif entry.is_file():
+                            files.append((Path(entry.path), entry.stat().st_mtime))
+                    except OSError as e:
+                        logging.warning("Cannot stat %s: %s", entry.path, e)
+        except OSError as e:
+            logging.warning("Cannot list %s: %s", cur, e)
+    # folder by folder, by name within each: copies read neighbouring inodes/blocks back to back
+    files.sort(key=lambda fm: (str(fm[0].parent), fm[0].name))
+    return dirs, files
+
+
+# progress bar: advance in batches of BAR_EVERY files (one redraw per batch on big trees)
+BAR_EVERY = 64
+STATUS_TEXT = {
+    "copied": "-> copied:  {}",
+    "skipped": "-> skipped: {} (dest newer/same)",
+    "failed": "-> failed:  {}",
+}
 
 
 def copystat_dir(src: Path, dst: Path):
@@ -91,10 +168,14 @@ def copystat_dir(src: Path, dst: Path):
         logging.debug("copystat failed on dir %s -> %s: %s", src, dst, e)
 
 
-def sync_tree(src_root: Path, dst_root: Path, title: str):
+def sync_tree(src_root: Path, dst_root: Path, title: str, show_bar: bool = True, workers: int = 1,
+              link_mode: str = "copy"):
     """
     Rough equivalent of:
       robocopy <src> <dst> /E /COPY:DAT /DCOPY:T /XO
+    show_bar=False when several trees sync at once (alive_progress draws one bar at a time).
+    workers: file copies in flight at once within this tree.
+    link_mode: see place_file().
     """
     if not src_root.exists():
         logging.info("%s: source does not exist, skipping (%s)", title, src_root)
@@ -102,39 +183,73 @@ def sync_tree(src_root: Path, dst_root: Path, title: str):
 
     # 1) Ensure directory tree exists at destination (and copy dir timestamps)
     created_dirs = 0
-    for d in iter_dirs(src_root):
+    dirs, files = walk_tree(src_root)
+    dir_pairs = []
+    for d in dirs:
         rel = d.relative_to(src_root)
         dd = dst_root / rel
         if not dd.exists():
             dd.mkdir(parents=True, exist_ok=True)
             created_dirs += 1
-        copystat_dir(d, dd)
+        try:
+            src_mtime = d.stat().st_mtime_ns
+        except OSError:
+            src_mtime = None
+        dir_pairs.append((d, dd, src_mtime))
 
-    files = iter_files(src_root)
     total = len(files)
     copied = skipped = failed = 0
 
     logging.info("%s: %d file(s) to evaluate", title, total)
-    with alive_bar(total, dual_line=True, title=title) as bar:
-        for f in files:
-            rel = f.relative_to(src_root)
-            df = dst_root / rel
-            df.parent.mkdir(parents=True, exist_ok=True)
-
-            try:
-                if newer_than(f, df):
-                    # copy2 ≈ COPY:DAT (data + basic metadata/timestamps)
-                    shutil.copy2(f, df)
-                    bar.text = f"-> copied:  {rel}"
+    def copy_one(f: Path, mtime: float):
+        rel = f.relative_to(src_root)
+        df = dst_root / rel  # its folder was made in step 1; no mkdir per file
+        try:
+            if newer_than(mtime, df):
+                # copy2 ≈ COPY:DAT (data + basic metadata/timestamps)
+                try:
+                    place_file(f, df, link_mode)
+                except FileNotFoundError:
+                    df.parent.mkdir(parents=True, exist_ok=True)  # folder vanished since step 1
+                    place_file(f, df, link_mode)
+                return "copied", rel
+            return "skipped", rel
+        except Exception as e:
+            logging.warning("Failed to copy %s -> %s: %s", f, df, e)
+            return "failed", rel
+
+    # the bar ticks every BAR_EVERY files, and the per-file line is only built for a terminal
+    show_text = sys.stdout.isatty()
+    pending = 0
+    with alive_bar(total, dual_line=True, title=title, disable=not show_bar) as bar:
+        # copies are I/O-bound: several in flight keep the disk/network queue busy
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for fut in as_completed([pool.submit(copy_one, f, mtime) for f, mtime in files]):
+                status, rel = fut.result()
+                if status == "copied":
                     copied += 1
-                else:
-                    bar.text = f"-> skipped: {rel} (dest newer/same)"
+                elif status == "skipped":
                     skipped += 1
-            except Exception as e:
-                failed += 1
-                bar.text = f"-> failed:  {rel}"
-                logging.warning("Failed to copy %s -> %s: %s", f, df, e)
-            bar()
+                else:
+                    failed += 1
+                if show_text:
+                    bar.text = STATUS_TEXT[status].format(rel)
+                pending += 1
+                if pending == BAR_EVERY:
+                    bar(pending)
+                    pending = 0
+            if pending:
+                bar(pending)
+
+    # folder timestamps last, compared only now: placing a file in a folder moves its mtime (always,
+    # in hardlink mode); copystat is a utime + chmod + xattr round, so it is skipped where they match
+    for d, dd, src_mtime in dir_pairs:
+        try:
+            dst_mtime = dd.stat().st_mtime_ns
+        except OSError:
+            dst_mtime = None
+        if src_mtime is None or dst_mtime != src_mtime:
+            copystat_dir(d, dd)
 
     logging.info(
         "%s: dirs created=%d, copied=%d, skipped=%d, failed=%d",
@@ -150,6 +265,25 @@ def main():
         default=Path(os.getenv("PEOPLE_IMAGES_DIR") or (SCRIPT_DIR / "Kometa-People-Images")),
         help="Destination root (default: PEOPLE_IMAGES_DIR env or ./Kometa-People-Images)",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=int(os.getenv("SYNC_JOBS", "1")),
+        help="Categories to sync at once (copies are I/O-bound; default: SYNC_JOBS env or 1)",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("SYNC_WORKERS", "8")),
+        help="File copies in flight per category (default: SYNC_WORKERS env or 8)",
+    )
+    ap.add_argument(
+        "--link-mode",
+        choices=("copy", "hardlink"),
+        default=os.getenv("SYNC_LINK_MODE", "copy"),
+        help="copy (default) or hardlink: link instead of copying when source and destination share a "
+             "filesystem; both paths are then the same file (default: SYNC_LINK_MODE env or copy)",
+    )
     args = ap.parse_args()
 
     src_base = CONFIG_DIR / "people_dirs"
@@ -159,12 +293,21 @@ def main():
     logging.info("Source base: %s", src_base)
     logging.info("Destination base: %s", dest_base)
 
-    for cat in CATEGORIES:
-        src = src_base / cat
-        dst = dest_base / cat
+    jobs = max(1, min(args.jobs, len(CATEGORIES)))
+
+    def sync_category(cat: str):
         title = f"sync {cat}"
         logging.info("---- %s ----", title)
-        sync_tree(src, dst, title)
+        sync_tree(src_base / cat, dest_base / cat, title, show_bar=(jobs == 1), workers=args.workers,
+                  link_mode=args.link_mode)
+
+    if jobs == 1:
+        for cat in CATEGORIES:
+            sync_category(cat)
+    else:
+        # each category is its own subtree: no shared destination paths between workers
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            list(pool.map(sync_category, CATEGORIES))
 
     elapsed = timer() - start
     logging.info("All done in %.2fs", elapsed)
@@ -2,10 +2,13 @@ import os
 import re
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from timeit import default_timer as timer
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from alive_progress import alive_bar
 from tmdbapis import TMDbAPIs
@@ -52,30 +55,58 @@ try:
 except ValueError:
     PERSON_DEPTH = 0
 
-TMDb = TMDbAPIs(TMDB_KEY, language="en")
+try:
+    DL_WORKERS = max(1, int(os.getenv("TMDB_DL_WORKERS", "16")))
+except ValueError:
+    DL_WORKERS = 16
+
+# One keep-alive session for the whole run: TMDb API calls and poster downloads reuse
+# their connections (one TLS handshake per host instead of one per request). Rate limits (429,
+# honouring Retry-After) and transient 5xx are retried with backoff; the pool fits every download worker.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=max(32, DL_WORKERS),
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset({"GET"}), raise_on_status=False),
+))
+
+TMDb = TMDbAPIs(TMDB_KEY, language="en", session=SESSION)
 
 
 # ---------- helpers ----------
+_BAD_PATH_CHARS = re.compile(r'[\\/:*?"<>|]+')
+
+
 def safe_filename(s: str) -> str:
     # keep it simple; strip bad path chars
-    return re.sub(r'[\\/:*?"<>|]+', "_", s)
+    return _BAD_PATH_CHARS.sub("_", s)
 
 
-def save_image(person) -> bool:
+def resolve_image(person):
+    """(profile url, target path) for a TMDb person, or None if they have no profile image."""
     if not person or not getattr(person, "profile_url", None):
-        return False
+        return None
+    file_root = f"{person.name}-{person.id}"
+    return person.profile_url, POSTERS_DIR / f"{safe_filename(file_root)}.jpg"
+
+
+def download_image(url: str, filepath: Path, label: str) -> bool:
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    writing = False
     try:
-        r = requests.get(person.profile_url, timeout=30)
-        r.raise_for_status()
+        # streamed to disk in 64 KiB chunks; the body is never held in memory whole
+        with SESSION.get(url, stream=True, timeout=30) as r:
+            r.raise_for_status()
+            with filepath.open("wb") as f:
+                writing = True
+                for chunk in r.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
     except requests.RequestException as e:
-        logging.warning("Download failed for %s (%s): %s", person.name, person.id, e)
+        if writing:
+            filepath.unlink(missing_ok=True)  # no half-written poster
+        logging.warning("Download failed for %s: %s", label, e)
         return False
-
-    file_root = f"{person.name}-{person.id}"
-    filepath = POSTERS_DIR / f"{safe_filename(file_root)}.jpg"
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    with filepath.open("wb") as f:
-        f.write(r.content)
     logging.info("Saved %s", filepath)
     return True
 
@@ -94,6 +125,17 @@ def main():
     logging.info("Loaded %d item(s) from %s", len(items), people_name_file)
     print(f"{len(items)} item(s) retrieved...")
 
+    # lookups stay on this thread; the image downloads they find run alongside on a pool
+    pool = ThreadPoolExecutor(max_workers=DL_WORKERS)
+    downloads = []
+
+    def queue_image(person) -> bool:
+        target = resolve_image(person)
+        if not target:
+            return False
+        downloads.append(pool.submit(download_image, *target, f"{person.name} ({person.id})"))
+        return True
+
     with alive_bar(len(items), dual_line=True, title="TMDB people") as bar:
         for item in items:
             bar.text = f"->   starting: {item}"
@@ -102,7 +144,7 @@ def main():
             try:
                 person = TMDb.person(int(item))
                 bar.text = f"-> retrieving (id): {item}"
-                save_image(person)
+                queue_image(person)
                 bar()
                 continue
             except ValueError:
@@ -131,14 +173,14 @@ def main():
                     try:
                         person = results[i]
                         bar.text = f"-> retrieving: {i + 1}-{item}"
-                        if save_image(person):
+                        if queue_image(person):
                             pulled += 1
                     except Exception as ex:
                         logging.warning("Exception on %s[%d]: %s", item, i, ex)
 
                 if upper == 0:
                     # If you prefer to always get at least the best match:
-                    # save_image(results[0])
+                    # queue_image(results[0])
                     pass
 
             except Exception as ex:
@@ -146,6 +188,14 @@ def main():
 
             bar()
 
+    saved = 0
+    with alive_bar(len(downloads), title="TMDB downloads") as bar:
+        for fut in as_completed(downloads):
+            saved += fut.result()
+            bar()
+    pool.shutdown()
+    logging.info("Downloaded %d of %d image(s)", saved, len(downloads))
+
     elapsed = timer() - start
     logging.info("Done in %.2fs", elapsed)
     print(f"Done in {elapsed:.2f}s")
@@ -1,8 +1,9 @@
 # rename_and_move_posters.py
-import re
+import os
 import sys
 import shutil
 import logging
+import logging.handlers
 from pathlib import Path
 from typing import Iterable
 
@@ -20,7 +21,11 @@ for d in (CONFIG_DIR, LOGS_DIR, DEFAULT_SRC):
 
 def setup_logging(level=logging.INFO, console=True):
     log_file = LOGS_DIR / f"{SCRIPT_PATH.stem}.log"
-    handlers = [logging.FileHandler(log_file, encoding="utf-8", mode="w")]
+    file_handler = logging.FileHandler(log_file, encoding="utf-8", mode="w")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    # one line per renamed/moved poster: batch them into the file (512 at a time, or at the first
+    # warning) instead of a write+flush per line
+    handlers = [logging.handlers.MemoryHandler(512, flushLevel=logging.WARNING, target=file_handler)]
     if console:
         handlers.append(logging.StreamHandler(sys.stdout))
     logging.basicConfig(
@@ -38,15 +43,26 @@ setup_logging()
 # ---------- core ----------
 def list_files(folder: Path, ext: str = ".jpg") -> Iterable[Path]:
     ext = ext.lower()
-    yield from (p for p in folder.iterdir() if p.is_file() and p.suffix.lower() == ext)
+    # one scandir, file type from the listing; taken as a list first because main() renames
+    # and moves files in this folder while iterating
+    with os.scandir(folder) as it:
+        entries = [e for e in it if e.is_file() and e.name.lower().endswith(ext) and len(e.name) > len(ext)]
+    yield from (Path(e.path) for e in entries)
 
 
 def normalized_name(fname: str, ext: str = ".jpg") -> str:
     """
     Remove a trailing -<digits> before the extension.
     Example: 'First_Last-12345.jpg' -> 'First_Last.jpg'
+    Plain string ops (one rpartition), no regex; the extension keeps its original case.
     """
-    return re.sub(rf"-\d+(?={re.escape(ext)}$)", "", fname, flags=re.IGNORECASE)
+    if len(fname) <= len(ext) or not fname.lower().endswith(ext.lower()):
+        return fname
+    base, tail_ext = fname[:-len(ext)], fname[-len(ext):]
+    head, sep, digits = base.rpartition("-")
+    if sep and digits.isdecimal():
+        return head + tail_ext
+    return fname
 
 
 def main():
@@ -75,27 +91,37 @@ def main():
     dup_count = 0
     move_count = 0
 
+    # names in source/destination, listed once and kept current below, so the duplicate and
+    # collision checks are set lookups rather than a stat each (normcase: case-blind on Windows)
+    key = os.path.normcase
+    src_names = {key(n) for n in os.listdir(src)}
+    dst_names = src_names if src == dst else {key(n) for n in os.listdir(dst)}
+
     for file in list_files(src, ext):
         new_name = normalized_name(file.name, ext=ext)
         new_src_path = file.with_name(new_name)
 
         # If the normalized name already exists in source and it's a different file -> treat as duplicate
-        if new_src_path.exists() and new_src_path != file:
+        if new_name != file.name and key(new_name) in src_names:
             target = duplicates_dir / file.name
             logging.info("Duplicate detected: %s -> %s", file.name, target)
             shutil.move(str(file), str(target))
+            src_names.discard(key(file.name))
             dup_count += 1
             continue
 
         # Rename in source if the name changed
         if new_name != file.name:
             logging.info("Renaming: %s -> %s", file.name, new_name)
+            src_names.discard(key(file.name))
             file = file.rename(new_src_path)
+            src_names.add(key(new_name))
 
         # Move to destination (if destination differs)
         if src != dst:
             final_path = dst / file.name
-            if final_path.exists():
+            src_names.discard(key(file.name))
+            if key(file.name) in dst_names:
                 # if collision in destination, send this one to duplicates
                 target = duplicates_dir / file.name
                 logging.info("Collision in target; moving to duplicates: %s -> %s", file.name, target)
@@ -104,11 +130,14 @@ def main():
             else:
                 logging.info("Moving: %s -> %s", file.name, final_path)
                 shutil.move(str(file), str(final_path))
+                dst_names.add(key(file.name))
                 move_count += 1
 
         count += 1
 
     logging.info("Done. Processed=%d, Renamed/Kept=%d, Duplicates=%d, Moved=%d", count, count, dup_count, move_count)
+    for h in logging.getLogger().handlers:
+        h.flush()  # the summary is in the file by the time the step ends
     print(f"Processed={count}, Duplicates={dup_count}, Moved={move_count}")
 
 
@@ -5,17 +5,21 @@ update_people_repos.py — update OR push all category repos under PEOPLE_IMAGES
 Categories: bw, diiivoy, diiivoycolor, rainier, original, signature, transparent
 
 Ops:
-  --op update   (default)  → make local exactly match remote:
-      git fetch origin
-      git switch <branch> (auto-create tracking if needed)
-      git reset --hard origin/<branch>
-      git clean -fd        (add -x when --clean-ignored)
+  --op update   (default)  → make local exactly match remote
+      (skipped when `git ls-remote` shows the checked-out branch is already at the remote tip and
+      the worktree is clean):
+      git fetch --progress --prune origin <branch>
+      git checkout -f -B <branch> --track origin/<branch>   (= switch + reset --hard, one process)
+      (ffonly: git switch <branch>, then git pull --ff-only origin <branch>;
+       a missing local branch is fetched and created tracking origin/<branch>)
+      git clean -fd        (add -x when --clean-ignored; skipped when status saw nothing to clean)
       (optional LFS pull when --lfs=auto/on and repo uses LFS)
       If anything fails, you can extend with a reclone fallback.
 
-  --op push               → stage, commit (if changes), and push:
+  --op push               → if anything changed: stage, commit, and push:
+      git status --porcelain   (nothing listed → done, no add/commit/push)
       git add -A
-      if changes: git commit -m "<message>"
+      git commit -m "<message>"
       git push origin HEAD
 
 Usage examples:
@@ -34,6 +38,7 @@ Common options:
   --message MSG              (only for --op push; default auto message)
   --git-user-name NAME       (optional: set user.name before committing)
   --git-user-email EMAIL     (optional: set user.email before committing)
+  --jobs N                   (category repos processed in parallel; default: all)
   --dry-run
 
 Environment:
@@ -41,23 +46,80 @@ Environment:
   UPDATE_MODE=hardreset|ffonly
   UPDATE_CLEAN_IGNORED=true|false
   UPDATE_LFS=auto|on|off
+  UPDATE_JOBS=N
+  UPDATE_LFS_TRANSFERS=N     (lfs.concurrenttransfers for `git lfs pull`; default 8)
 """
 
+import mmap
 import os
+import re
 import sys
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+# Absolute path exported by orchestrator.py (saves a PATH search per git call); plain "git" otherwise
+GIT = os.getenv("GIT_BIN") or "git"
+
+# LFS objects downloaded at once per repo (UPDATE_LFS_TRANSFERS env)
+LFS_TRANSFERS = int(os.getenv("UPDATE_LFS_TRANSFERS", "8"))
 
 CATEGORIES = ["bw", "diiivoy", "diiivoycolor", "rainier", "original", "signature", "transparent"]
 
+# With --jobs > 1 each worker thread tags its output with its category (see main)
+_TAG = threading.local()
+_SAY_LOCK = threading.Lock()
+
+
+# git's transfer progress ("Receiving objects:  43% (100/230), 1.20 MiB | 800.00 KiB/s"); in parallel
+# runs at most one such line per PROGRESS_EVERY seconds per repo is passed on (plus the final ", done.")
+_PROGRESS_RE = re.compile(r"^(?:remote: )?[A-Z][a-z]+(?: [a-z]+)*:\s+\d+% ")
+PROGRESS_EVERY = 2.0
+
 
-def run(cmd, cwd: Path, dry: bool, capture=False) -> Tuple[int, str, str]:
-    print("→", " ".join(cmd), f"(cwd={cwd})")
+def say(*parts) -> None:
+    """print(), prefixed with "[category] " when categories run in parallel; whole lines only."""
+    tag = getattr(_TAG, "cat", "")
+    line = " ".join(str(p) for p in parts)
+    with _SAY_LOCK:
+        sys.stdout.write((f"[{tag}] {line}" if tag else line) + "\n")
+        sys.stdout.flush()
+
+
+def run(cmd, cwd: Path, dry: bool, capture=False, quiet=False) -> Tuple[int, str, str]:
+    """quiet=True: only the exit code matters; git's output goes to DEVNULL (no pipes, nothing decoded)."""
+    say("→", " ".join(cmd), f"(cwd={cwd})")
     if dry:
         return 0, "", ""
-    cp = subprocess.run(cmd, cwd=str(cwd), text=True, capture_output=capture)
+    if quiet and not capture:
+        cp = subprocess.run(cmd, cwd=str(cwd), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return cp.returncode, "", ""
+    # git writes UTF-8 (paths, commit messages) whatever the locale; pin it so Windows code pages
+    # don't mis-decode or raise on odd bytes
+    if getattr(_TAG, "cat", "") and not capture:
+        # parallel run: pass git's output on as whole tagged lines while it runs (a long fetch shows
+        # progress as it goes) instead of buffering it all until exit or letting it interleave
+        with subprocess.Popen(cmd, cwd=str(cwd), encoding="utf-8", errors="replace", bufsize=1,
+                              stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as p:
+            shown = 0.0
+            for ln in p.stdout:  # text mode: each "\r" progress redraw arrives as its own line
+                ln = ln.rstrip()  # remote: lines are padded with spaces
+                if not ln:
+                    continue
+                if _PROGRESS_RE.match(ln) and not ln.endswith("done."):
+                    now = time.monotonic()
+                    if now - shown < PROGRESS_EVERY:
+                        continue
+                    shown = now
+                say("  " + ln)
+        return p.returncode, "", ""
+    # single run: git writes straight to the terminal unless the caller wants the text
+    cp = subprocess.run(cmd, cwd=str(cwd), encoding="utf-8", errors="replace", capture_output=capture)
     return cp.returncode, (cp.stdout or ""), (cp.stderr or "")
 
 
@@ -71,97 +133,178 @@ def run_cap(cmd, cwd: Path, dry: bool) -> Tuple[bool, str]:
     return rc == 0, out.strip()
 
 
+# remote URL -> default branch, from `git remote show origin` (one network round trip per remote per run)
+_remote_head_cache: Dict[str, str] = {}
+
+
 def detect_remote_head_branch(repo: Path, dry: bool) -> str:
-    ok, out = run_cap(["git", "remote", "show", "origin"], repo, dry)
+    # origin/HEAD as recorded by clone / `remote set-head`: read locally, no network
+    ok, out = run_cap([GIT, "symbolic-ref", "--short", "refs/remotes/origin/HEAD"], repo, dry)
+    if ok and out.startswith("origin/"):
+        return out[len("origin/"):]
+    ok, url = run_cap([GIT, "config", "--get", "remote.origin.url"], repo, dry)
+    if ok and url in _remote_head_cache:
+        return _remote_head_cache[url]
+    ok, out = run_cap([GIT, "remote", "show", "origin"], repo, dry)
     if ok:
         for line in out.splitlines():
             if line.lower().startswith("head branch:"):
-                return line.split(":", 1)[1].strip()
+                head = line.split(":", 1)[1].strip()
+                if url:
+                    _remote_head_cache[url] = head
+                return head
     for b in ("main", "master"):
-        rc, _, _ = run(["git", "rev-parse", "--verify", f"origin/{b}"], repo, dry)
+        rc, _, _ = run([GIT, "rev-parse", "--verify", f"origin/{b}"], repo, dry, quiet=True)
         if rc == 0:
             return b
-    ok, out = run_cap(["git", "rev-parse", "--abbrev-ref", "HEAD"], repo, dry)
+    ok, out = run_cap([GIT, "rev-parse", "--abbrev-ref", "HEAD"], repo, dry)
     return out or "master"
 
 
 def repo_uses_lfs(repo: Path, dry: bool) -> bool:
-    gattr = repo / ".gitattributes"
-    if not gattr.exists():
-        return False
+    # byte search over an mmap of .gitattributes: nothing decoded or copied into a str
     try:
-        txt = gattr.read_text(encoding="utf-8", errors="ignore")
-    except Exception:
+        with open(repo / ".gitattributes", "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False  # mmap can't map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(b"filter=lfs") != -1
+    except (OSError, ValueError):
         return False
-    return "filter=lfs" in txt
 
 
-def git_lfs_available(cwd: Path, dry: bool) -> bool:
-    rc, _, _ = run(["git", "lfs", "version"], cwd, dry)
+_LFS_PROBE_LOCK = threading.Lock()
+
+
+def git_lfs_available(dry: bool) -> bool:
+    # whether git-lfs is installed doesn't depend on the repo: asked once per run, not per category;
+    # the lock makes categories running in parallel wait for that one probe instead of each starting one
+    with _LFS_PROBE_LOCK:
+        return _probe_git_lfs(dry)
+
+
+@lru_cache(maxsize=None)
+def _probe_git_lfs(dry: bool) -> bool:
+    rc, _, _ = run([GIT, "lfs", "version"], Path.cwd(), dry, quiet=True)
     return rc == 0
 
 
+def check_remote_match(repo: Path, branch: str, clean_ignored: bool, dry: bool) -> Tuple[bool, bool]:
+    """
+    (up_to_date, needs_clean) from two processes: `ls-remote` (tip SHA only, no pack negotiation) and one
+    `status --porcelain=v2 --branch --ignored` (HEAD, branch and worktree state together).
+    up_to_date: <branch> is checked out at the remote tip with nothing to clean, i.e. an update would
+    change nothing. needs_clean: status listed untracked entries, or ignored ones that clean could still
+    reach (-x, or a new HEAD whose .gitignore may differ); a reset never creates those, so `git clean`
+    after it is only needed when this is True.
+    """
+    ok, out = run_cap([GIT, "ls-remote", "origin", f"refs/heads/{branch}"], repo, dry)
+    remote_sha = out.split()[0] if ok and out else ""
+    if not remote_sha:
+        return False, True
+    ok, out = run_cap([GIT, "status", "--porcelain=v2", "--branch", "--ignored"], repo, dry)
+    if not ok:
+        return False, True
+    headers = {}
+    changed = untracked = ignored = False
+    for line in out.splitlines():
+        if line.startswith("# "):
+            key, _, value = line[2:].partition(" ")
+            headers[key] = value
+        elif line.startswith("? "):
+            untracked = True
+        elif line.startswith("! "):
+            ignored = True
+        else:
+            changed = True  # modified/staged/unmerged tracked file: the reset has work to do
+    at_tip = headers.get("branch.oid") == remote_sha
+    needs_clean = untracked or (ignored and (clean_ignored or not at_tip))
+    up_to_date = (at_tip and not changed and not needs_clean and headers.get("branch.head") == branch
+                  and headers.get("branch.upstream") == f"origin/{branch}")
+    return up_to_date, needs_clean
+
+
 def ensure_remote_match(repo: Path, branch: str, mode: str, clean_ignored: bool, lfs_mode: str, dry: bool) -> bool:
-    # fetch
-    if not run_ok(["git", "fetch", "origin"], repo, dry):
+    up_to_date, needs_clean = check_remote_match(repo, branch, clean_ignored, dry)
+    if up_to_date:
+        say(f"  up to date with origin/{branch} (ls-remote match); nothing to fetch")
+    elif not sync_to_remote(repo, branch, mode, clean_ignored, needs_clean, dry):
         return False
 
-    # switch (create tracking if needed)
-    if not run_ok(["git", "switch", branch], repo, dry):
-        run_ok(["git", "switch", "-c", branch, "--track", f"origin/{branch}"], repo, dry)
+    # LFS pull if applicable
+    if lfs_mode in ("on", "auto") and repo_uses_lfs(repo, dry) and git_lfs_available(dry):
+        # LFS_TRANSFERS objects in flight within the repo (git-lfs default: 3); categories already overlap
+        run_ok([GIT, "-c", f"lfs.concurrenttransfers={LFS_TRANSFERS}", "lfs", "pull"], repo, dry)
+
+    return True
+
+
+def sync_to_remote(repo: Path, branch: str, mode: str, clean_ignored: bool, needs_clean: bool, dry: bool) -> bool:
+    if mode == "ffonly" and run_ok([GIT, "switch", branch], repo, dry):
+        # branch already exists locally: fetch + fast-forward in one git process
+        return run_ok([GIT, "pull", "--progress", "--ff-only", "--prune", "origin", branch], repo, dry)
+
+    # fetch only the branch we track (git still updates origin/<branch>); other branches and tags on
+    # the remote are not negotiated or downloaded
+    # --progress: git reports transfer progress and rate even when its output is piped (parallel runs)
+    if not run_ok([GIT, "fetch", "--progress", "--prune", "origin", branch], repo, dry):
+        return False
 
     if mode == "hardreset":
-        if not run_ok(["git", "reset", "--hard", f"origin/{branch}"], repo, dry):
-            return False
-        clean_args = ["git", "clean", "-fd"]
-        if clean_ignored:
-            clean_args.append("-x")
-        if not run_ok(clean_args, repo, dry):
+        # switch + reset --hard in one git process: (re)point <branch> at origin/<branch>, tracking it,
+        # check it out and discard local changes (-f)
+        if not run_ok([GIT, "checkout", "-f", "-B", branch, "--track", f"origin/{branch}"], repo, dry):
             return False
+        # the status in check_remote_match already walked the worktree: skip clean's own walk when it
+        # found nothing to remove
+        if needs_clean:
+            clean_args = [GIT, "clean", "-fd"]
+            if clean_ignored:
+                clean_args.append("-x")
+            if not run_ok(clean_args, repo, dry):
+                return False
     else:
-        if not run_ok(["git", "merge", "--ff-only", f"origin/{branch}"], repo, dry):
+        # no local branch yet (switch failed above): create it tracking the ref just fetched
+        run_ok([GIT, "switch", "-c", branch, "--track", f"origin/{branch}"], repo, dry)
+        if not run_ok([GIT, "merge", "--ff-only", f"origin/{branch}"], repo, dry):
             return False
-
-    # LFS pull if applicable
-    if lfs_mode in ("on", "auto") and repo_uses_lfs(repo, dry) and git_lfs_available(repo, dry):
-        run_ok(["git", "lfs", "pull"], repo, dry)
-
     return True
 
 
 def commit_and_push(repo: Path, branch: Optional[str], message: str,
                     user_name: str, user_email: str, dry: bool) -> int:
+    # any changes? (untracked files included) — checked before staging, so an unchanged repo costs
+    # one status and no `add -A` pass over the worktree
+    ok, status = run_cap([GIT, "status", "--porcelain", "-z"], repo, dry)
+    if not ok:
+        return 1
+    if not status.strip("\0"):
+        say("  (no changes to commit)")
+        return 0
+
     # set author config if provided
     if user_name:
-        run_ok(["git", "config", "user.name", user_name], repo, dry)
+        run_ok([GIT, "config", "user.name", user_name], repo, dry)
     if user_email:
-        run_ok(["git", "config", "user.email", user_email], repo, dry)
+        run_ok([GIT, "config", "user.email", user_email], repo, dry)
 
     # stage everything
-    if not run_ok(["git", "add", "-A"], repo, dry):
+    if not run_ok([GIT, "add", "-A"], repo, dry):
         return 1
 
-    # any changes?
-    ok, status = run_cap(["git", "status", "--porcelain"], repo, dry)
-    if not ok:
-        return 1
-    if not status.strip():
-        print("  (no changes to commit)")
-        return 0
-
     # commit
-    if not run_ok(["git", "commit", "-m", message], repo, dry):
+    if not run_ok([GIT, "commit", "-m", message], repo, dry):
         return 1
 
     # ensure branch value
     if not branch:
-        ok, cur = run_cap(["git", "rev-parse", "--abbrev-ref", "HEAD"], repo, dry)
+        ok, cur = run_cap([GIT, "rev-parse", "--abbrev-ref", "HEAD"], repo, dry)
         branch = cur if ok and cur else "master"
 
     # push
-    if not run_ok(["git", "push", "origin", "HEAD"], repo, dry):
+    if not run_ok([GIT, "push", "origin", "HEAD"], repo, dry):
         # fallback to named branch push
-        return 0 if run_ok(["git", "push", "origin", branch], repo, dry) else 1
+        return 0 if run_ok([GIT, "push", "origin", branch], repo, dry) else 1
     return 0
 
 
@@ -183,40 +326,71 @@ def main():
     parser.add_argument("--message", help="Commit message (only used with --op push)")
     parser.add_argument("--git-user-name", help="Set git user.name locally before commit (push op)")
     parser.add_argument("--git-user-email", help="Set git user.email locally before commit (push op)")
+    parser.add_argument("--jobs", type=int, default=int(os.getenv("UPDATE_JOBS", str(len(CATEGORIES)))),
+                        help="Category repos to fetch/push at once (each repo is independent; network-bound; "
+                             "default: UPDATE_JOBS env or all of them)")
     parser.add_argument("--dry-run", action="store_true")
     args = parser.parse_args()
 
     repo_root = Path(args.repo_root or os.getenv("PEOPLE_IMAGES_DIR", "")).expanduser().resolve()
-    if not repo_root.exists():
+    # one listing of the root tells which category folders exist (no stat per category)
+    try:
+        with os.scandir(repo_root) as it:
+            present = {e.name for e in it if e.is_dir()}
+    except OSError:
         print(f"[ERROR] Repo root not found: {repo_root}")
         sys.exit(2)
 
     branch_arg = args.branch or os.getenv("PEOPLE_BRANCH")
 
-    rc_total = 0
-    for cat in CATEGORIES:
+    def process(cat: str) -> bool:
+        """Update or push one category repo; True on success."""
         repo = repo_root / cat
-        if not repo.exists():
-            print(f"[WARN] Skipping missing category folder: {repo}")
-            continue
+        if cat not in present:
+            say(f"[WARN] Skipping missing category folder: {repo}")
+            return True
+        # its own repo? (git would otherwise act on an enclosing one); .git may be a file for worktrees
+        try:
+            os.stat(repo / ".git")
+        except OSError:
+            say(f"[WARN] Skipping category folder that is not a git repo: {repo}")
+            return True
 
         if args.op == "update":
             # determine branch per-repo if not provided
             branch = branch_arg or detect_remote_head_branch(repo, args.dry_run)
-            print(f"=== UPDATE {cat} (branch: {branch}, mode: {args.mode}) ===")
-            ok = ensure_remote_match(repo, branch, args.mode, args.clean_ignored, args.lfs, args.dry_run)
-            rc_total |= (not ok)
+            say(f"=== UPDATE {cat} (branch: {branch}, mode: {args.mode}) ===")
+            return ensure_remote_match(repo, branch, args.mode, args.clean_ignored, args.lfs, args.dry_run)
         else:
             # push op
             # for push, default to current branch if not specified
             push_branch = branch_arg
             now = datetime.now().strftime("%Y-%m-%d %H:%M")
             msg = args.message or f"chore: sync posters & docs — {now}"
-            print(f"=== PUSH {cat} ===")
+            say(f"=== PUSH {cat} ===")
             rc = commit_and_push(repo, push_branch, msg, args.git_user_name or "", args.git_user_email or "", args.dry_run)
-            rc_total |= (rc != 0)
+            return rc == 0
+
+    def process_tagged(cat: str) -> bool:
+        _TAG.cat = cat
+        try:
+            return process(cat)
+        finally:
+            _TAG.cat = ""
+
+    # Each category is its own repo, so fetch/push of different repos overlap: wall time is the
+    # slowest repo rather than the sum (output lines are tagged with their category)
+    jobs = max(1, min(args.jobs, len(CATEGORIES)))
+    if jobs == 1:
+        results = [process(cat) for cat in CATEGORIES]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(process_tagged, CATEGORIES))
 
-    sys.exit(0 if rc_total == 0 else 1)
+    failed = [cat for cat, ok in zip(CATEGORIES, results) if not ok]
+    print(f"Summary ({args.op}): ok={len(results) - len(failed)}, failed={len(failed)}"
+          + (f" ({', '.join(failed)})" if failed else ""))
+    sys.exit(0 if not failed else 1)
 
 
 if __name__ == "__main__":